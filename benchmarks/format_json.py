@@ -0,0 +1,100 @@
+"""
+Compare the response parsers on large sparse-array responses.
+
+Usage:
+    $ python benchmarks/format_json.py [captured_response.txt ...]
+
+Without arguments a response shaped like a real ``translate_a/single``
+answer (many sentences, empty slots, dictionary entries) is generated. The
+generated text avoids quotes and ",," inside strings, which the legacy
+parser does not handle.
+"""
+
+import json
+import random
+import sys
+import timeit
+
+from googletrans import utils
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def generate_response(sentences: int = 2000) -> str:
+    rng = random.Random(0)
+    words = [
+        "lorem",
+        "ipsum",
+        "dolor",
+        "sit",
+        "amet,",
+        "안녕",
+        "こんにちは",
+    ]
+
+    def sentence() -> str:
+        return " ".join(rng.choice(words) for _ in range(rng.randint(3, 12)))
+
+    segments = ",".join(
+        json.dumps(
+            [sentence(), sentence(), None, None, 3],
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).replace("null", "")
+        for _ in range(sentences)
+    )
+    dictionary = ",".join(
+        '["noun",["{0}","{1}"],[["{0}",["{1}"],,0.5]],"{0}",1]'.format(
+            rng.choice(words).replace('"', ""), rng.choice(words).replace('"', "")
+        )
+        for _ in range(sentences // 10)
+    )
+    return '[[{}],[{}],"en",,,,0.96954316,,[["en"],,[0.96954316],["en"]]]'.format(
+        segments, dictionary
+    )
+
+
+def bench(name: str, func, text: str, number: int) -> float:
+    seconds = min(timeit.repeat(lambda: func(text), number=number, repeat=3))
+    print(f"  {name:<28}{seconds / number * 1000:10.3f} ms")
+    return seconds
+
+
+def main() -> None:
+    if len(sys.argv) > 1:
+        samples = []
+        for path in sys.argv[1:]:
+            with open(path, encoding="utf-8") as f:
+                samples.append((path, f.read()))
+    else:
+        samples = [
+            (f"generated ({n} sentences)", generate_response(n)) for n in (200, 2000)
+        ]
+
+    for name, text in samples:
+        print(f"{name}: {len(text)} chars")
+        assert utils.legacy_format_json(text) == utils.format_json(text)
+        number = 5
+        bench("legacy_format_json", utils.legacy_format_json, text, number)
+        bench(
+            "fill_sparse_arrays + json",
+            lambda t: json.loads(utils.fill_sparse_arrays(t)),
+            text,
+            number,
+        )
+        if orjson is not None:
+            bench(
+                "fill_sparse_arrays + orjson",
+                lambda t: orjson.loads(utils.fill_sparse_arrays(t)),
+                text,
+                number,
+            )
+        else:
+            print("  (install orjson to include it)")
+
+
+if __name__ == "__main__":
+    main()
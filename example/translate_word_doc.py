@@ -1,5 +1,5 @@
 from docx import Document
-from googletrans import Translator
+from googletrans import SyncTranslator
 
 
 def translate_doc(filename, destination="zh-CN", mix=True):
@@ -10,20 +10,16 @@ def translate_doc(filename, destination="zh-CN", mix=True):
         :param mix=True: if True, will have original language and target language into the same doc. paragraphs by paragraphs.
     """
 
-    def tx(t):
-        return Translator().translate(t, dest=destination).text
-
     doc = Document(filename)
-    for p in doc.paragraphs:
-        txd = tx(p.text)
+    cells = [cell for table in doc.tables for row in table.rows for cell in row.cells]
+    texts = [p.text for p in doc.paragraphs] + [cell.text for cell in cells]
 
-        p.text = p.text + ("\n" + txd if mix else "")
+    # a single batch call reuses one connection pool for every paragraph
+    with SyncTranslator() as translator:
+        translations = translator.translate(texts, dest=destination)
 
-    for table in doc.tables:
-        for row in table.rows:
-            for cell in row.cells:
-                txd = tx(cell.text)
-                p.text = cell.text + ("\n" + txd if mix else "")
+    for item, translated in zip(doc.paragraphs + cells, translations):
+        item.text = item.text + ("\n" + translated.text if mix else "")
 
     f = filename.replace(".doc", destination.lower() + ".doc")
     doc.save(f)
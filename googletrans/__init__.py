@@ -1,8 +1,9 @@
 """Free Google Translate API for Python. Translates totally free of charge."""
 
-__all__ = ("Translator",)
+__all__ = ("Translator", "SyncTranslator")
 __version__ = "3.4.0"
 
 
 from googletrans.client import Translator
 from googletrans.constants import LANGCODES, LANGUAGES  # noqa
+from googletrans.sync import SyncTranslator
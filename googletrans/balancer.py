@@ -0,0 +1,152 @@
+"""
+Health-aware selection of service URLs.
+
+Instead of picking uniformly at random, :class:`ServiceBalancer` keeps an
+exponentially weighted moving average (EWMA) of the latency and error rate
+of every host, prefers fast healthy hosts and ejects hosts that keep
+failing for a cooldown period (a simple circuit breaker).
+"""
+
+import random
+import threading
+import time
+import typing
+
+
+class _HostState:
+    __slots__ = (
+        "latency",
+        "error_rate",
+        "failures",
+        "open_until",
+        "requests",
+        "probing",
+    )
+
+    def __init__(self) -> None:
+        self.latency: typing.Optional[float] = None
+        self.error_rate = 0.0
+        self.failures = 0
+        self.open_until = 0.0
+        self.requests = 0
+        self.probing = False
+
+
+class ServiceBalancer:
+    """Load balancer over service URLs
+
+    :param hosts: service hosts, e.g. ``['translate.google.com', 'translate.google.co.kr']``.
+    :type hosts: a sequence of strings
+
+    :param alpha: weight of the newest observation in the moving averages.
+    :type alpha: :class:`float`
+
+    :param failure_threshold: consecutive failures after which a host is ejected.
+    :type failure_threshold: :class:`int`
+
+    :param cooldown: seconds an ejected host is kept out of rotation before it
+                     is tried again.
+    :type cooldown: :class:`float`
+    """
+
+    def __init__(
+        self,
+        hosts: typing.Sequence[str],
+        alpha: float = 0.3,
+        failure_threshold: int = 3,
+        cooldown: float = 30.0,
+    ):
+        if not hosts:
+            raise ValueError("at least one host is required")
+
+        self.hosts = list(hosts)
+        self.alpha = alpha
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._states = {host: _HostState() for host in self.hosts}
+        self._lock = threading.Lock()
+
+    def _score(self, state: _HostState) -> float:
+        # error-prone hosts look proportionally slower
+        return (state.latency or 0.0) * (1.0 + 10.0 * state.error_rate)
+
+    def pick(self) -> str:
+        """Return the host the next request should go to"""
+        if len(self.hosts) == 1:
+            return self.hosts[0]
+
+        now = time.monotonic()
+        with self._lock:
+            available = [h for h in self.hosts if self._states[h].open_until <= now]
+            if not available:
+                # every host is ejected: use the one that recovers first
+                return min(self.hosts, key=lambda h: self._states[h].open_until)
+
+            # send a single probe to each host without measurements
+            unexplored = [
+                h
+                for h in available
+                if self._states[h].latency is None and not self._states[h].probing
+            ]
+            if unexplored:
+                host = random.choice(unexplored)
+                self._states[host].probing = True
+                return host
+
+            measured = [h for h in available if self._states[h].latency is not None]
+            if not measured:
+                # only probes in flight: spread over them until one answers
+                return random.choice(available)
+            if len(measured) == 1:
+                return measured[0]
+
+            # power of two choices keeps load spread over the good hosts
+            first, second = random.sample(measured, 2)
+            if self._score(self._states[first]) <= self._score(self._states[second]):
+                return first
+            return second
+
+    def record(self, host: str, latency: float, ok: bool) -> None:
+        """Feed the outcome of a request to ``host`` back into the balancer"""
+        with self._lock:
+            state = self._states.get(host)
+            if state is None:
+                return
+
+            state.requests += 1
+            state.probing = False
+            if state.latency is None:
+                state.latency = latency
+            else:
+                state.latency += self.alpha * (latency - state.latency)
+            state.error_rate += self.alpha * ((0.0 if ok else 1.0) - state.error_rate)
+
+            if ok:
+                state.failures = 0
+                state.open_until = 0.0
+                return
+
+            state.failures += 1
+            if state.failures >= self.failure_threshold:
+                state.open_until = time.monotonic() + self.cooldown
+
+    def release(self, host: str) -> None:
+        """Give back a pick that ended without an outcome, e.g. a cancelled
+        request, so that an unmeasured host can be probed again"""
+        with self._lock:
+            state = self._states.get(host)
+            if state is not None:
+                state.probing = False
+
+    def stats(self) -> typing.Dict[str, typing.Dict[str, typing.Any]]:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                host: {
+                    "latency": state.latency,
+                    "error_rate": state.error_rate,
+                    "requests": state.requests,
+                    "ejected": state.open_until > now,
+                }
+                for host, state in self._states.items()
+            }
@@ -0,0 +1,260 @@
+"""
+Translation result caches.
+
+A cache sits in front of the network call made by
+:meth:`googletrans.Translator._translate` and stores the decoded response
+for a given (text, src, dest, override) combination, so that repeated
+requests for the same strings never leave the process.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import typing
+import unicodedata
+from collections import OrderedDict
+
+
+def make_key(
+    text: str,
+    src: str,
+    dest: str,
+    override: typing.Optional[typing.Dict[str, typing.Any]],
+) -> str:
+    """Build a stable cache key for a translation request.
+
+    The text is NFC normalized so that visually identical inputs share an
+    entry, and override parameters are sorted so that their order does not
+    matter.
+    """
+    payload = json.dumps(
+        [
+            unicodedata.normalize("NFC", text),
+            src,
+            dest,
+            sorted((str(k), v) for k, v in (override or {}).items()),
+        ],
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class BaseCache:
+    """Base class for translation caches
+
+    Subclasses implement :meth:`_get`, :meth:`_set`, :meth:`_delete` and
+    :meth:`clear`; hit and miss counters are maintained here.
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    def _get(self, key: str) -> typing.Optional[typing.Any]:
+        raise NotImplementedError
+
+    def _set(self, key: str, value: typing.Any) -> None:
+        raise NotImplementedError
+
+    def _delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def get(self, key: str) -> typing.Optional[typing.Any]:
+        value = self._get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: str, value: typing.Any) -> None:
+        self._set(key, value)
+
+    def delete(self, key: str) -> None:
+        self._delete(key)
+
+    def stats(self) -> typing.Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+
+class MemoryCache(BaseCache):
+    """In-memory LRU cache with optional time-to-live
+
+    :param maxsize: maximum number of entries kept; the least recently used
+                    entry is evicted first.
+    :type maxsize: :class:`int`
+
+    :param ttl: number of seconds an entry stays valid. ``None`` keeps
+                entries until they are evicted by size.
+    :type ttl: :class:`float`
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: typing.Optional[float] = None):
+        super().__init__()
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, typing.Tuple[float, typing.Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _get(self, key: str) -> typing.Optional[typing.Any]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires, value = item
+            if expires and expires < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def _set(self, key: str, value: typing.Any) -> None:
+        expires = time.monotonic() + self.ttl if self.ttl else 0.0
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def _delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class SQLiteCache(BaseCache):
+    """Persistent cache stored in a SQLite database
+
+    Entries survive restarts and can be shared by several processes on the
+    same host. Values are stored as JSON, so the decoded response list can
+    be used to rebuild :attr:`Translated.extra_data` later on.
+
+    Reads and writes are blocking calls made on the calling thread. A
+    database locked by another process is waited for at most
+    :attr:`BUSY_TIMEOUT` seconds before :class:`sqlite3.OperationalError`
+    is raised.
+
+    :param path: path of the database file.
+    :type path: :class:`str`
+
+    :param max_entries: maximum number of rows kept; the oldest rows are
+                        removed by every write that goes past it. ``None``
+                        means unlimited.
+    :type max_entries: :class:`int`
+
+    :param max_age: number of seconds an entry stays valid. ``None`` keeps
+                    entries forever. Expired rows are never returned, and are
+                    deleted every :attr:`PRUNE_INTERVAL` writes.
+    :type max_age: :class:`float`
+    """
+
+    PRUNE_INTERVAL = 128
+    BUSY_TIMEOUT = 5.0
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: typing.Optional[int] = None,
+        max_age: typing.Optional[float] = None,
+    ):
+        super().__init__()
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._conn = sqlite3.connect(
+            path, timeout=self.BUSY_TIMEOUT, check_same_thread=False
+        )
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS translations ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS translations_created "
+                "ON translations (created)"
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute(
+                "SELECT COUNT(*) FROM translations"
+            ).fetchone()
+        return count
+
+    def _get(self, key: str) -> typing.Optional[typing.Any]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created FROM translations WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        value, created = row
+        if self.max_age is not None and created + self.max_age < time.time():
+            self._delete(key)
+            return None
+        return json.loads(value)
+
+    def _set(self, key: str, value: typing.Any) -> None:
+        payload = json.dumps(value, ensure_ascii=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO translations (key, value, created) "
+                "VALUES (?, ?, ?)",
+                (key, payload, time.time()),
+            )
+            self._writes += 1
+            if self._writes % self.PRUNE_INTERVAL == 0:
+                self._prune()
+            else:
+                self._evict()
+
+    def _delete(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM translations WHERE key = ?", (key,))
+
+    def _prune(self) -> None:
+        # callers hold the lock and an open transaction
+        if self.max_age is not None:
+            self._conn.execute(
+                "DELETE FROM translations WHERE created < ?",
+                (time.time() - self.max_age,),
+            )
+        self._evict()
+
+    def _evict(self) -> None:
+        # callers hold the lock and an open transaction
+        if self.max_entries is not None:
+            self._conn.execute(
+                "DELETE FROM translations WHERE key IN ("
+                "SELECT key FROM translations ORDER BY created DESC "
+                "LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def prune(self) -> None:
+        """Remove expired entries and enforce ``max_entries`` right away"""
+        with self._lock, self._conn:
+            self._prune()
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM translations")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,64 @@
+"""Command-line interface of googletrans"""
+
+import argparse
+
+from googletrans.constants import DEFAULT_CLIENT_SERVICE_URLS
+from googletrans.gtoken import FileSeedStore, SeedManager
+from googletrans.sync import SyncTranslator
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Python Google Translator as a command-line tool"
+    )
+    parser.add_argument("text", help="The text you want to translate.")
+    parser.add_argument(
+        "-d",
+        "--dest",
+        default="en",
+        help="The destination language you want to translate. (Default: en)",
+    )
+    parser.add_argument(
+        "-s",
+        "--src",
+        default="auto",
+        help="The source language you want to translate. (Default: auto)",
+    )
+    parser.add_argument("-c", "--detect", action="store_true", default=False, help="")
+    parser.add_argument(
+        "-u",
+        "--service-url",
+        action="append",
+        dest="service_urls",
+        help="The service URL to use, e.g. translate.google.com. Can be repeated. "
+        "(Default: translate.googleapis.com)",
+    )
+    args = parser.parse_args()
+
+    # the web app hosts need a token: short-lived processes reuse the seed of
+    # earlier invocations
+    seed_manager = SeedManager(store=FileSeedStore())
+    with SyncTranslator(
+        service_urls=args.service_urls or DEFAULT_CLIENT_SERVICE_URLS,
+        seed_manager=seed_manager,
+    ) as translator:
+        if args.detect:
+            result = translator.detect(args.text)
+            result = f"""
+[{result.lang}, {result.confidence}] {args.text}
+            """.strip()
+            print(result)
+            return
+
+        result = translator.translate(args.text, dest=args.dest, src=args.src)
+        result = f"""
+[{result.src}] {result.origin}
+    ->
+[{result.dest}] {result.text}
+[pron.] {result.pronunciation}
+        """.strip()
+        print(result)
+
+
+if __name__ == "__main__":
+    main()
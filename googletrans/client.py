@@ -5,28 +5,125 @@ You can translate text using this module.
 """
 
 import asyncio
-import random
+import collections
+import contextvars
+import copy
+import functools
 import re
+import time
 import typing
+import weakref
 
 import httpx
 from httpx import Response, Timeout
 from httpx._types import ProxyTypes
 
-from googletrans import urls, utils
+from googletrans import masking, urls, utils
+from googletrans.balancer import ServiceBalancer
+from googletrans.cache import BaseCache, make_key
+from googletrans.concurrency import AdaptiveLimiter
 from googletrans.constants import (
     DEFAULT_CLIENT_SERVICE_URLS,
+    DEFAULT_FIELDS,
     DEFAULT_RAISE_EXCEPTION,
     DEFAULT_USER_AGENT,
+    DT_FIELDS,
     DUMMY_DATA,
     LANGCODES,
     LANGUAGES,
     SPECIAL_CASES,
 )
-from googletrans.gtoken import TokenAcquirer
+from googletrans.detection import LocalDetector
+from googletrans.exceptions import RequestError, ServiceUnavailable, TooManyRequests
+from googletrans.gtoken import SeedManager, TokenAcquirer
 from googletrans.models import Detected, Translated
+from googletrans.ratelimit import RateLimiter
+from googletrans.retry import RetryPolicy, parse_retry_after
 
 EXCLUDES = ("en", "ca", "fr")
+# codes the service uses interchangeably
+SAME_LANGUAGES = {"he": "iw", "jv": "jw"}
+PACK_MAX_CHARS = 1800
+DEFAULT_MAX_CHUNK_BYTES = 4500
+DEFAULT_POST_THRESHOLD = 1500
+# httpx's own default pool
+DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+R = typing.TypeVar("R", Translated, Detected)
+
+# set while the masked texts of a protected call, or the texts of a call with
+# protect=False, are translated, so that the per-item and per-chunk calls made
+# on the way do not mask them (again)
+_masked: "contextvars.ContextVar[bool]" = contextvars.ContextVar(
+    "googletrans_masked", default=False
+)
+
+
+# per-host request slots of every client, shared by the translators using it
+_HostSlots = typing.Dict[typing.Tuple[str, int], asyncio.Semaphore]
+_host_semaphores: "weakref.WeakKeyDictionary[httpx.AsyncClient, _HostSlots]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def _aiter(
+    items: typing.Union[typing.Iterable[str], typing.AsyncIterable[str]],
+) -> typing.AsyncIterator[str]:
+    if hasattr(items, "__aiter__"):
+        async for item in typing.cast(typing.AsyncIterable[str], items):
+            yield item
+    else:
+        for item in typing.cast(typing.Iterable[str], items):
+            yield item
+
+
+def _fan_out(
+    items: typing.List[str], unique: typing.List[str], results: typing.List[R]
+) -> typing.List[R]:
+    """Spread the results of the unique items back over the original
+    positions. Repeats get their own shallow copy of the result."""
+    by_item = dict(zip(unique, results))
+    fanned = []
+    seen = set()
+    for item in items:
+        result = by_item[item]
+        fanned.append(copy.copy(result) if item in seen else result)
+        seen.add(item)
+    return fanned
+
+
+def _restore_masked(result: Translated, origin: str, pieces: typing.List[str]) -> bool:
+    """Unmask a result of :func:`googletrans.masking.mask`'ed text in place.
+    Return ``False`` if the tokens can not be put back."""
+    text = masking.unmask(result.text, pieces)
+    if text is None:
+        return False
+
+    result.origin = origin
+    result.text = text
+    loader = result._loader
+    if loader is None:
+        result.pronunciation = _unmask_value(result.pronunciation, pieces)
+    else:
+        # a partial of module-level functions keeps the result picklable
+        result._loader = functools.partial(_unmask_details, loader, pieces)
+    return True
+
+
+def _unmask_value(
+    value: typing.Optional[str], pieces: typing.List[str]
+) -> typing.Optional[str]:
+    if not value:
+        return value
+    return masking.unmask(value, pieces) or value
+
+
+def _unmask_details(
+    loader: typing.Callable[[], typing.Tuple[typing.Optional[str], typing.Any]],
+    pieces: typing.List[str],
+) -> typing.Tuple[typing.Optional[str], typing.Any]:
+    pronunciation, extra_data = loader()
+    return _unmask_value(pronunciation, pieces), extra_data
 
 
 class Translator:
@@ -34,7 +131,8 @@ class Translator:
 
     You have to create an instance of Translator to use this API
 
-    :param service_urls: google translate url list. URLs will be used randomly.
+    :param service_urls: google translate url list. Requests are spread over the URLs,
+                         preferring fast and healthy ones (see ``balancer``).
                          For example ``['translate.google.com', 'translate.google.co.kr']``
                          To preferably use the non webapp api, service url should be translate.googleapis.com
     :type service_urls: a sequence of strings
@@ -44,11 +142,94 @@ class Translator:
 
     :param proxy: httpx proxy configuration.
 
+    :param limits: connection pool limits (pool size, keep-alive connections and
+                   keep-alive expiry) of the HTTP client.
+    :type limits: :class:`httpx.Limits`
+
+    :param max_connections_per_host: maximum number of requests in flight to a single
+                                     service host. With HTTP/2 they are multiplexed over
+                                     warm connections instead of opening new ones.
+                                     Translators sharing a ``client`` with the same cap
+                                     share the slots as well.
+    :type max_connections_per_host: :class:`int`
+
+    :param client: an existing client to send requests with, e.g. to share one connection
+                   pool between several translators. ``user_agent``, ``proxy``, ``timeout``,
+                   ``http2`` and ``limits`` are then ignored, and the client is not closed
+                   by the translator.
+    :type client: :class:`httpx.AsyncClient`
+
     :param timeout: Definition of timeout for httpx library.
                     Will be used for every request.
     :type timeout: number or a double of numbers
-    :param raise_exception: if `True` then raise exception if smth will go wrong
+    :param raise_exception: if `True` then raise :class:`googletrans.exceptions.RequestError`
+                            (or a subclass) when the service answers with an unexpected status code
     :type raise_exception: boolean
+
+    :param list_operation_pack_size: maximum number of short strings packed into a single
+                                     request when a list is translated. ``1`` disables packing.
+                                     Packed results carry no ``extra_data``.
+    :type list_operation_pack_size: :class:`int`
+
+    :param max_chunk_bytes: texts longer than this many UTF-8 bytes are split on paragraph and
+                            sentence boundaries, translated concurrently and reassembled.
+    :type max_chunk_bytes: :class:`int`
+
+    :param post_threshold: texts longer than this many UTF-8 bytes are sent in a form-encoded
+                           POST body instead of the query string, which keeps URLs short.
+                           ``None`` always uses GET.
+    :type post_threshold: :class:`int`
+
+    :param concurrency_limiter: adaptive limiter used for list operations instead of the fixed
+                                ``list_operation_max_concurrency`` semaphore.
+    :type concurrency_limiter: :class:`googletrans.concurrency.AdaptiveLimiter`
+
+    :param rate_limiter: token-bucket limiter consulted before every request. The same
+                         limiter can be shared by several translators.
+    :type rate_limiter: :class:`googletrans.ratelimit.RateLimiter`
+
+    :param retry: retry policy for throttling, server errors and timeouts.
+                  By default every request is attempted once.
+    :type retry: :class:`googletrans.retry.RetryPolicy`
+
+    :param balancer: balancer choosing among ``service_urls``. A default
+                     :class:`googletrans.balancer.ServiceBalancer` is created when omitted.
+    :type balancer: :class:`googletrans.balancer.ServiceBalancer`
+
+    :param seed_manager: holder of the hourly token seed used in webapp mode. Translators share
+                         :data:`googletrans.gtoken.DEFAULT_SEED_MANAGER` by default.
+    :type seed_manager: :class:`googletrans.gtoken.SeedManager`
+
+    :param lean: do not keep the :class:`httpx.Response` on results, which
+                 saves a lot of memory on large batches.
+    :type lean: boolean
+
+    :param fields: response parts to request by default: ``'text'`` (translation only),
+                   ``'pronunciation'`` (translation and pronunciation) or ``'full'``
+                   (everything, including ``extra_data``). Smaller levels download and
+                   decode much less. Can be overridden per call.
+    :type fields: :class:`str`
+
+    :param local_detector: offline detector answering :meth:`detect` for text whose script
+                           identifies the language with enough confidence, e.g. Hangul,
+                           Kana or Cyrillic. Other text is still sent to the service.
+    :type local_detector: :class:`googletrans.detection.LocalDetector`
+
+    :param short_circuit: answer locally, without a request, when the text needs no translation:
+                          ``src`` equals ``dest``, the text has nothing translatable in it
+                          (numbers, URLs, placeholders, codes, emoji), or offline detection
+                          (``local_detector``, or a default one) finds it is already in ``dest``.
+                          The text is then returned unchanged.
+    :type short_circuit: boolean
+
+    :param protect: mask HTML tags, entities, ``{placeholders}``, ``%s`` format specifiers and URLs
+                    with short tokens before sending and restore them afterwards
+                    (see :mod:`googletrans.masking`). Can be overridden per call.
+    :type protect: boolean
+
+    :param cache: optional cache for decoded responses, e.g. :class:`googletrans.cache.MemoryCache`.
+                  Cache hits are answered without any HTTP round trip.
+    :type cache: :class:`googletrans.cache.BaseCache`
     """
 
     def __init__(
@@ -59,23 +240,46 @@ class Translator:
         proxy: typing.Optional[ProxyTypes] = None,
         timeout: typing.Optional[Timeout] = None,
         http2: bool = True,
+        limits: typing.Optional[httpx.Limits] = None,
+        max_connections_per_host: typing.Optional[int] = None,
+        client: typing.Optional[httpx.AsyncClient] = None,
         list_operation_max_concurrency: int = 2,
+        list_operation_pack_size: int = 1,
+        max_chunk_bytes: int = DEFAULT_MAX_CHUNK_BYTES,
+        post_threshold: typing.Optional[int] = DEFAULT_POST_THRESHOLD,
+        concurrency_limiter: typing.Optional[AdaptiveLimiter] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        retry: typing.Optional[RetryPolicy] = None,
+        balancer: typing.Optional[ServiceBalancer] = None,
+        seed_manager: typing.Optional[SeedManager] = None,
+        lean: bool = False,
+        fields: str = DEFAULT_FIELDS,
+        local_detector: typing.Optional[LocalDetector] = None,
+        short_circuit: bool = False,
+        protect: bool = False,
+        cache: typing.Optional[BaseCache] = None,
     ):
-        self.client = httpx.AsyncClient(
-            http2=http2,
-            proxy=proxy,
-            headers={
-                "User-Agent": user_agent,
-            },
-        )
+        self._owns_client = client is None
+        if client is None:
+            client = httpx.AsyncClient(
+                http2=http2,
+                proxy=proxy,
+                headers={
+                    "User-Agent": user_agent,
+                },
+                limits=limits or DEFAULT_LIMITS,
+            )
+        self.client = client
 
         self.service_urls = ["translate.google.com"]
         self.client_type = "webapp"
         self.token_acquirer = TokenAcquirer(
-            client=self.client, host=self.service_urls[0]
+            client=self.client,
+            host=self.service_urls[0],
+            seed_manager=seed_manager,
         )
 
-        if timeout is not None:
+        if timeout is not None and self._owns_client:
             self.client.timeout = timeout
 
         if service_urls:
@@ -83,7 +287,9 @@ class Translator:
             self.service_urls = service_urls
             self.client_type = "webapp"
             self.token_acquirer = TokenAcquirer(
-                client=self.client, host=self.service_urls[0]
+                client=self.client,
+                host=self.service_urls[0],
+                seed_manager=seed_manager,
             )
 
             # if we have a service url pointing to client api we force the use of it as defaut client
@@ -96,57 +302,257 @@ class Translator:
 
         self.raise_exception = raise_exception
         self.list_operation_max_concurrency = list_operation_max_concurrency
+        self.list_operation_pack_size = list_operation_pack_size
+        self.max_chunk_bytes = max_chunk_bytes
+        self.post_threshold = post_threshold
+        self.max_connections_per_host = max_connections_per_host
+        self._in_flight: typing.Dict[str, asyncio.Future] = {}
+        self.concurrency_limiter = concurrency_limiter
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.balancer = balancer
+        self._balanced_urls = self.service_urls if balancer is not None else None
+        self.lean = lean
+        self.fields = self._check_fields(fields)
+        self.local_detector = local_detector
+        self.short_circuit = short_circuit
+        self._identity_detector = local_detector or LocalDetector()
+        self.protect = protect
+        self.cache = cache
+
+    def _list_limiter(
+        self, concurrency_limit: typing.Optional[int] = None
+    ) -> typing.AsyncContextManager[typing.Any]:
+        """Concurrency guard for list operations: the adaptive limiter if one is
+        configured, otherwise a fixed semaphore."""
+        if concurrency_limit is None and self.concurrency_limiter is not None:
+            return self.concurrency_limiter
+        return asyncio.Semaphore(
+            concurrency_limit or self.list_operation_max_concurrency
+        )
+
+    @staticmethod
+    def _check_fields(fields: str) -> str:
+        if fields not in DT_FIELDS:
+            raise ValueError(
+                "invalid fields {!r}, expected one of {}".format(
+                    fields, ", ".join(DT_FIELDS)
+                )
+            )
+        return fields
+
+    def _resolve_fields(self, kwargs: typing.Dict[str, typing.Any]) -> None:
+        """Turn the ``fields`` option of a call into a ``dt`` override.
+
+        Once set, the ``dt`` override travels with the other overrides into
+        the requests, the cache key and recursive calls for list items and
+        chunks.
+        """
+        fields = kwargs.pop("fields", None)
+        if fields is None and "dt" in kwargs:
+            return
+        fields = self._check_fields(fields or self.fields)
+        # the default level is left implicit so cache keys stay unchanged
+        if fields != DEFAULT_FIELDS or self.fields != DEFAULT_FIELDS:
+            kwargs["dt"] = list(DT_FIELDS[fields])
+
+    def _identity(self, text: str, dest: str, src: str) -> typing.Optional[Translated]:
+        """Result for a text that needs no translation, or ``None``"""
+        if src == dest or not utils.is_translatable(text):
+            return Translated(
+                src=src, dest=dest, origin=text, text=text, pronunciation=text
+            )
+
+        if src != "auto":
+            # the caller knows the language better than the detector
+            return None
+
+        detected = self._identity_detector.detect(text)
+        if detected is not None and SAME_LANGUAGES.get(
+            detected[0], detected[0]
+        ) == SAME_LANGUAGES.get(dest, dest):
+            return Translated(
+                src=detected[0], dest=dest, origin=text, text=text, pronunciation=text
+            )
+        return None
+
+    def _record_outcome(self, host: str, latency: float, ok: bool) -> None:
+        if self.concurrency_limiter is not None:
+            self.concurrency_limiter.record(latency, ok)
+        self._get_balancer().record(host, latency, ok)
+
+    def _release_host(self, host: str) -> None:
+        if len(self.service_urls) > 1:
+            self._get_balancer().release(host)
+
+    def _get_balancer(self) -> ServiceBalancer:
+        # service_urls may be reassigned after construction
+        if self.balancer is None or self._balanced_urls is not self.service_urls:
+            self.balancer = ServiceBalancer(self.service_urls)
+            self._balanced_urls = self.service_urls
+        return self.balancer
 
     def _pick_service_url(self) -> str:
         if len(self.service_urls) == 1:
             return self.service_urls[0]
-        return random.choice(self.service_urls)
+        return self._get_balancer().pick()
 
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.client.aclose()
+        if self._owns_client:
+            await self.client.aclose()
 
     async def _translate(
         self, text: str, dest: str, src: str, override: typing.Dict[str, typing.Any]
-    ) -> typing.Tuple[typing.List[typing.Any], Response]:
-        token = "xxxx"  # dummy default value here as it is not used by api client
-        if self.client_type == "webapp":
-            token = await self.token_acquirer.do(text)
-
-        params = utils.build_params(
-            client=self.client_type,
-            query=text,
-            src=src,
-            dest=dest,
-            token=token,
-            override=override,
-        )
+    ) -> typing.Tuple[typing.List[typing.Any], typing.Optional[Response]]:
+        key = make_key(text, src, dest, override)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached, None
+
+        # identical requests already on the wire share their outcome
+        while key in self._in_flight:
+            pending = self._in_flight[key]
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # the request we waited for was cancelled: send our own
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            result = await self._request_translation(text, dest, src, override, key)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # waiters are optional, don't warn if there are none
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._in_flight[key]
 
-        url = urls.TRANSLATE.format(host=self._pick_service_url())
-        r = await self.client.get(url, params=params)
+    async def _request_translation(
+        self,
+        text: str,
+        dest: str,
+        src: str,
+        override: typing.Dict[str, typing.Any],
+        cache_key: str,
+    ) -> typing.Tuple[typing.List[typing.Any], typing.Optional[Response]]:
+        attempt = 1
+        while True:
+            request = await self.build_request(text, dest, src, override)
+            host = request.url.host
+            semaphore = self._host_semaphore(host)
+            acquired = False
+            transport_error: typing.Optional[httpx.TransportError] = None
+            started = time.monotonic()
+            try:
+                if semaphore is not None:
+                    await semaphore.acquire()
+                    acquired = True
+                    started = time.monotonic()
+                r = await self.client.send(request)
+            except httpx.TransportError as e:
+                transport_error = e
+            except BaseException:
+                # a cancelled request must not leave the host marked as probed
+                self._release_host(host)
+                raise
+            finally:
+                latency = time.monotonic() - started
+                if acquired:
+                    typing.cast(asyncio.Semaphore, semaphore).release()
+
+            if transport_error is not None:
+                # refused connections and the like count against the host too
+                self._record_outcome(host, latency, ok=False)
+                if (
+                    not isinstance(transport_error, httpx.TimeoutException)
+                    or self.retry is None
+                    or not self.retry.retry_on_timeout
+                    or not self.retry.can_retry(attempt)
+                ):
+                    raise transport_error
+                await asyncio.sleep(self.retry.delay(attempt))
+                attempt += 1
+                continue
+
+            self._record_outcome(
+                host, latency, ok=r.status_code != 429 and r.status_code < 500
+            )
 
-        if r.status_code == 200:
-            data = utils.format_json(r.text)
-            if not isinstance(data, list):
-                data = [data]  # Convert dict to list to match return type
-            return data, r
+            if r.status_code == 200:
+                data = utils.format_json(r.text)
+                if not isinstance(data, list):
+                    data = [data]  # Convert dict to list to match return type
+                if self.cache is not None:
+                    self.cache.set(cache_key, data)
+                return data, r
+
+            if self.retry is None or not self.retry.should_retry(
+                attempt, r.status_code
+            ):
+                break
+            await asyncio.sleep(self.retry.delay(attempt, r))
+            attempt += 1
 
         if self.raise_exception:
-            raise Exception(
-                'Unexpected status code "{}" from {}'.format(
-                    r.status_code, self.service_urls
-                )
-            )
+            raise self._status_error(r)
+
+        data = copy.deepcopy(DUMMY_DATA)
+        data[0][0][0] = text
+        return data, r
+
+    def _host_semaphore(self, host: str) -> typing.Optional[asyncio.Semaphore]:
+        """Slot guard for requests to ``host`` when a per-host cap is configured.
 
-        DUMMY_DATA[0][0][0] = text
-        return DUMMY_DATA, r
+        The slot is held only while the request is in flight, so neither the
+        wait for it nor retry back-off counts towards the measured latency.
+        """
+        if self.max_connections_per_host is None:
+            return None
+        semaphores = _host_semaphores.setdefault(self.client, {})
+        key = (host, self.max_connections_per_host)
+        semaphore = semaphores.get(key)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_connections_per_host)
+            semaphores[key] = semaphore
+        return semaphore
+
+    def _status_error(self, response: Response) -> RequestError:
+        message = 'Unexpected status code "{}" from {}'.format(
+            response.status_code, self.service_urls
+        )
+        if response.status_code == 429:
+            return TooManyRequests(
+                message, response, retry_after=parse_retry_after(response)
+            )
+        if response.status_code >= 500:
+            return ServiceUnavailable(message, response)
+        return RequestError(message, response)
 
     async def build_request(
         self, text: str, dest: str, src: str, override: typing.Dict[str, typing.Any]
     ) -> httpx.Request:
-        """Async helper for making the translation request"""
+        """Async helper for making the translation request
+
+        Waits for the rate limiter, if any, so the returned request may be
+        sent right away. Texts above ``post_threshold`` bytes are moved from
+        the query string into a form-encoded POST body.
+        """
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire(len(text))
+
         token = "xxxx"  # dummy default value here as it is not used by api client
         if self.client_type == "webapp":
             token = await self.token_acquirer.do(text)
@@ -162,10 +568,19 @@ class Translator:
 
         url = urls.TRANSLATE.format(host=self._pick_service_url())
 
+        if self.post_threshold is not None and (
+            len(text.encode("utf-8")) > self.post_threshold
+        ):
+            query = params.pop("q")
+            return self.client.build_request(
+                "POST", url, params=params, data={"q": query}
+            )
+
         return self.client.build_request("GET", url, params=params)
 
+    @staticmethod
     def _parse_extra_data(
-        self, data: typing.List[typing.Any]
+        data: typing.List[typing.Any],
     ) -> typing.Dict[str, typing.Any]:
         response_parts_name_mapping = {
             0: "translation",
@@ -228,6 +643,15 @@ class Translator:
                     the system will attempt to identify the source language automatically.
         :param src: :class:`str`; :class:`unicode`
 
+        :param protect: mask markup, placeholders and URLs while translating,
+                        overriding the translator default.
+        :type protect: boolean
+
+        :param fields: response parts to request, overriding the translator default:
+                       ``'text'``, ``'pronunciation'`` or ``'full'``.
+                       ``extra_data`` is ``None`` unless ``'full'`` is requested.
+        :type fields: :class:`str`
+
         :rtype: Translated
         :rtype: :class:`list` (when a list is passed)
 
@@ -268,11 +692,49 @@ class Translator:
             else:
                 raise ValueError("invalid destination language")
 
+        if not _masked.get():
+            if kwargs.pop("protect", self.protect):
+                return await self._translate_protected(text, dest, src, kwargs)
+            if self.protect:
+                # keep the items and chunks of this call unmasked as well
+                token = _masked.set(True)
+                try:
+                    return await self.translate(text, dest=dest, src=src, **kwargs)
+                finally:
+                    _masked.reset(token)
+        kwargs.pop("protect", None)
+
+        self._resolve_fields(kwargs)
+
         if isinstance(text, list):
-            concurrency_limit = kwargs.pop(
-                "list_operation_max_concurrency", self.list_operation_max_concurrency
+            unique = list(dict.fromkeys(text))
+            if len(unique) < len(text):
+                results = await self.translate(unique, dest=dest, src=src, **kwargs)
+                return _fan_out(text, unique, results)
+
+            if self.short_circuit:
+                identities = [self._identity(item, dest, src) for item in text]
+                pending = [item for item, r in zip(text, identities) if r is None]
+                if len(pending) < len(text):
+                    translated = iter(
+                        await self.translate(pending, dest=dest, src=src, **kwargs)
+                        if pending
+                        else []
+                    )
+                    return [
+                        r if r is not None else next(translated) for r in identities
+                    ]
+
+            concurrency_limit = kwargs.pop("list_operation_max_concurrency", None)
+            pack_size = kwargs.pop(
+                "list_operation_pack_size", self.list_operation_pack_size
             )
-            semaphore = asyncio.Semaphore(concurrency_limit)
+            semaphore = self._list_limiter(concurrency_limit)
+
+            if pack_size > 1:
+                return await self._translate_packed(
+                    text, dest, src, kwargs, semaphore, pack_size
+                )
 
             async def translate_with_semaphore(item):
                 async with semaphore:
@@ -282,14 +744,22 @@ class Translator:
             result = await asyncio.gather(*tasks)
             return result
 
+        if self.short_circuit:
+            identity = self._identity(text, dest, src)
+            if identity is not None:
+                return identity
+
+        if len(text) * 4 > self.max_chunk_bytes and (
+            len(text.encode("utf-8")) > self.max_chunk_bytes
+        ):
+            return await self._translate_chunked(text, dest, src, kwargs)
+
         origin = text
         data, response = await self._translate(text, dest, src, kwargs)
 
         # this code will be updated when the format is changed.
         translated = "".join([d[0] if d[0] else "" for d in data[0]])
 
-        extra_data = self._parse_extra_data(data)
-
         # actual source language that will be recognized by Google Translator when the
         # src passed is equal to auto.
         try:
@@ -297,6 +767,51 @@ class Translator:
         except Exception:  # pragma: nocover
             pass
 
+        # pronunciation and extra data are decoded on first access. The raw body
+        # is much smaller than the decoded lists, so keep that when we have it.
+        source: typing.Union[str, typing.List[typing.Any]] = data
+        if response is not None and response.status_code == 200:
+            source = response.text
+
+        # put final values into a new Translated object
+        result = Translated(
+            src=src,
+            dest=dest,
+            origin=origin,
+            text=translated,
+            loader=functools.partial(
+                self._parse_details,
+                source,
+                origin,
+                dest,
+                translated,
+                self._wants_extra_data(kwargs),
+            ),
+            response=None if self.lean else response,
+            status=None if response is None else response.status_code,
+        )
+
+        return result
+
+    @staticmethod
+    def _parse_details(
+        source: typing.Union[str, typing.List[typing.Any]],
+        origin: str,
+        dest: str,
+        translated: str,
+        extra: bool = True,
+    ) -> typing.Tuple[
+        typing.Optional[str], typing.Optional[typing.Dict[str, typing.Any]]
+    ]:
+        """Decode the pronunciation and extra data of a translation
+
+        Results keep this as their lazy loader, so it must not hold on to the
+        translator: results stay picklable.
+        """
+        data = utils.format_json(source) if isinstance(source, str) else source
+        if not isinstance(data, list):
+            data = [data]
+
         pron = origin
         try:
             pron = data[0][1][-2]
@@ -312,18 +827,268 @@ class Translator:
         if dest in EXCLUDES and pron == origin:
             pron = translated
 
-        # put final values into a new Translated object
-        result = Translated(
-            src=src,
+        return pron, Translator._parse_extra_data(data) if extra else None
+
+    @staticmethod
+    def _wants_extra_data(override: typing.Dict[str, typing.Any]) -> bool:
+        dt = override.get("dt")
+        if dt is None:
+            return True
+        if isinstance(dt, str):
+            dt = [dt]
+        return any(part not in DT_FIELDS["pronunciation"] for part in dt)
+
+    async def translate_stream(
+        self,
+        texts: typing.Union[typing.Iterable[str], typing.AsyncIterable[str]],
+        dest: str = "en",
+        src: str = "auto",
+        ordered: bool = True,
+        window: typing.Optional[int] = None,
+        **kwargs: typing.Any,
+    ) -> typing.AsyncIterator[Translated]:
+        """Translate a (possibly unbounded) stream of texts
+
+        Texts are pulled from ``texts`` lazily and at most ``window`` of them
+        are in flight at any time, so memory stays bounded no matter how long
+        the input is.
+
+        :param texts: the source texts.
+        :type texts: iterable or async iterable of :class:`str`
+
+        :param ordered: yield results in input order. If `False`, results are
+                        yielded as soon as they complete.
+        :type ordered: boolean
+
+        :param window: maximum number of in-flight requests. Defaults to
+                       ``list_operation_max_concurrency``.
+        :type window: :class:`int`
+
+        Usage:
+            >>> async for translation in translator.translate_stream(lines, dest='ko'):
+            ...     print(translation.text)
+        """
+        window = window or self.list_operation_max_concurrency
+        iterator = _aiter(texts)
+        pending: typing.Deque[asyncio.Task] = collections.deque()
+        exhausted = False
+
+        async def fill() -> None:
+            nonlocal exhausted
+            while not exhausted and len(pending) < window:
+                try:
+                    item = await iterator.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                pending.append(
+                    asyncio.ensure_future(
+                        self.translate(item, dest=dest, src=src, **kwargs)
+                    )
+                )
+
+        try:
+            await fill()
+            while pending:
+                if ordered:
+                    task = pending.popleft()
+                    result = await task
+                else:
+                    done, _ = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    task = next(t for t in pending if t in done)
+                    pending.remove(task)
+                    result = task.result()
+                await fill()
+                yield result
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _translate_packed(
+        self,
+        texts: typing.List[str],
+        dest: str,
+        src: str,
+        override: typing.Dict[str, typing.Any],
+        semaphore: typing.AsyncContextManager[typing.Any],
+        pack_size: int,
+    ) -> typing.List[Translated]:
+        """Translate a list by packing several short strings into each request.
+
+        Packs whose response can not be split back into the same number of
+        segments are retried item by item.
+        """
+        results: typing.List[typing.Optional[Translated]] = [None] * len(texts)
+        packs, singles = utils.pack_segments(
+            texts, max_items=pack_size, max_chars=PACK_MAX_CHARS
+        )
+
+        async def translate_single(index):
+            async with semaphore:
+                results[index] = await self.translate(
+                    texts[index], dest=dest, src=src, **override
+                )
+
+        async def translate_pack(indices):
+            async with semaphore:
+                items = [texts[i] for i in indices]
+                data, response = await self._translate(
+                    utils.PACK_DELIMITER.join(items), dest, src, override
+                )
+                translated = "".join([d[0] if d[0] else "" for d in data[0]])
+                parts = utils.unpack_segments(translated, len(items))
+
+                if parts is None:
+                    for index in indices:
+                        results[index] = await self.translate(
+                            texts[index], dest=dest, src=src, **override
+                        )
+                    return
+
+                try:
+                    detected_src = data[2]
+                except Exception:  # pragma: nocover
+                    detected_src = src
+
+                for index, origin, part in zip(indices, items, parts):
+                    results[index] = Translated(
+                        src=detected_src,
+                        dest=dest,
+                        origin=origin,
+                        text=part,
+                        pronunciation=part if dest in EXCLUDES else origin,
+                        extra_data=None,
+                        response=None if self.lean else response,
+                        status=None if response is None else response.status_code,
+                    )
+
+        await asyncio.gather(
+            *[translate_pack(indices) for indices in packs],
+            *[translate_single(index) for index in singles],
+        )
+        return typing.cast(typing.List[Translated], results)
+
+    async def _translate_protected(
+        self,
+        text: typing.Union[str, typing.List[str]],
+        dest: str,
+        src: str,
+        override: typing.Dict[str, typing.Any],
+    ) -> typing.Union[Translated, typing.List[Translated]]:
+        """Translate with markup and placeholders masked.
+
+        Results whose tokens did not survive the translation are translated
+        again without masking.
+        """
+        items = text if isinstance(text, list) else [text]
+        masked = [masking.mask(item) for item in items]
+
+        token = _masked.set(True)
+        try:
+            if not any(pieces for _, pieces in masked):
+                return await self.translate(text, dest=dest, src=src, **override)
+
+            results = await self.translate(
+                [masked_text for masked_text, _ in masked],
+                dest=dest,
+                src=src,
+                **override,
+            )
+
+            failed = [
+                index
+                for index, (item, (_, pieces), result) in enumerate(
+                    zip(items, masked, results)
+                )
+                if not _restore_masked(result, item, pieces)
+            ]
+            if failed:
+                retried = await self.translate(
+                    [items[index] for index in failed], dest=dest, src=src, **override
+                )
+                for index, result in zip(failed, retried):
+                    results[index] = result
+        finally:
+            _masked.reset(token)
+
+        return results if isinstance(text, list) else results[0]
+
+    async def _translate_chunked(
+        self,
+        text: str,
+        dest: str,
+        src: str,
+        override: typing.Dict[str, typing.Any],
+    ) -> Translated:
+        """Translate a text that is too long for a single request.
+
+        The text is split with :func:`googletrans.utils.split_text`, the
+        chunks are translated concurrently and the results are merged into
+        one :class:`Translated`, keeping the whitespace around each chunk.
+        """
+        chunks = utils.split_text(text, self.max_chunk_bytes)
+        # not the shared limiter: a list item may already hold one of its slots
+        semaphore = asyncio.Semaphore(self.list_operation_max_concurrency)
+
+        async def translate_chunk(chunk):
+            stripped = chunk.strip()
+            if not stripped:
+                return None
+            async with semaphore:
+                return await self.translate(stripped, dest=dest, src=src, **override)
+
+        results = await asyncio.gather(*[translate_chunk(c) for c in chunks])
+
+        translated_parts = []
+        pronunciation_parts = []
+        for chunk, result in zip(chunks, results):
+            if result is None:
+                translated_parts.append(chunk)
+                pronunciation_parts.append(chunk)
+                continue
+            stripped = chunk.strip()
+            head = chunk[: len(chunk) - len(chunk.lstrip())]
+            tail = chunk[len(head) + len(stripped) :]
+            translated_parts.append(head + result.text + tail)
+            pronunciation_parts.append(head + (result.pronunciation or "") + tail)
+
+        translated = [r for r in results if r is not None]
+        return Translated(
+            src=translated[0].src if translated else src,
             dest=dest,
-            origin=origin,
-            text=translated,
-            pronunciation=pron,
-            extra_data=extra_data,
-            response=response,
+            origin=text,
+            text="".join(translated_parts),
+            pronunciation="".join(pronunciation_parts),
+            extra_data=self._merge_extra_data([r.extra_data for r in translated]),
+            response=translated[0]._response if translated else None,
+            status=max(
+                (r._status for r in translated if r._status is not None),
+                default=None,
+            ),
         )
 
-        return result
+    def _merge_extra_data(
+        self, extras: typing.List[typing.Optional[typing.Dict[str, typing.Any]]]
+    ) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        """Merge the extra data of chunk translations: list values are
+        concatenated, other values are taken from the first chunk having one.
+        """
+        extras = [extra for extra in extras if extra]
+        if not extras:
+            return None
+
+        merged: typing.Dict[str, typing.Any] = {}
+        for extra in extras:
+            for key, value in extra.items():
+                if value is None:
+                    merged.setdefault(key, None)
+                elif isinstance(value, list) and isinstance(merged.get(key), list):
+                    merged[key] = merged[key] + value
+                elif merged.get(key) is None:
+                    merged[key] = value
+        return merged
 
     @typing.overload
     async def detect(self, text: str, **kwargs: typing.Any) -> Detected: ...
@@ -367,10 +1132,12 @@ class Translator:
             fr 0.043500196
         """
         if isinstance(text, list):
-            concurrency_limit = kwargs.pop(
-                "list_operation_max_concurrency", self.list_operation_max_concurrency
-            )
-            semaphore = asyncio.Semaphore(concurrency_limit)
+            unique = list(dict.fromkeys(text))
+            if len(unique) < len(text):
+                return _fan_out(text, unique, await self.detect(unique, **kwargs))
+
+            concurrency_limit = kwargs.pop("list_operation_max_concurrency", None)
+            semaphore = self._list_limiter(concurrency_limit)
 
             async def detect_with_semaphore(item):
                 async with semaphore:
@@ -380,6 +1147,11 @@ class Translator:
             result = await asyncio.gather(*tasks)
             return result
 
+        if self.local_detector is not None:
+            guess = self.local_detector.detect(text)
+            if guess is not None:
+                return Detected(lang=guess[0], confidence=guess[1])
+
         data, response = await self._translate(text, "en", "auto", kwargs)
 
         # actual source language that will be recognized by Google Translator when the
@@ -395,6 +1167,11 @@ class Translator:
                 confidence = data[8][-2][0]
         except Exception:  # pragma: nocover
             pass
-        result = Detected(lang=src, confidence=confidence, response=response)
+        result = Detected(
+            lang=src,
+            confidence=confidence,
+            response=None if self.lean else response,
+            status=None if response is None else response.status_code,
+        )
 
         return result
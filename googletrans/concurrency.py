@@ -0,0 +1,143 @@
+"""
+Adaptive concurrency control for list operations.
+
+:class:`AdaptiveLimiter` is a drop-in replacement for the fixed
+``asyncio.Semaphore`` used by :meth:`googletrans.Translator.translate` and
+:meth:`googletrans.Translator.detect` when a list is passed. The limit grows
+additively while requests succeed quickly and shrinks multiplicatively
+(AIMD) on throttling, server errors and timeouts.
+"""
+
+import asyncio
+import collections
+import time
+import typing
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limiter
+
+    :param initial: starting concurrency limit.
+    :type initial: :class:`int`
+
+    :param min_limit: lower bound of the limit.
+    :type min_limit: :class:`int`
+
+    :param max_limit: upper bound of the limit.
+    :type max_limit: :class:`int`
+
+    :param increase: amount added to the limit for each full window of
+                     successful requests.
+    :type increase: :class:`float`
+
+    :param decrease: factor applied to the limit on a failure.
+    :type decrease: :class:`float`
+
+    :param latency_target: successful requests slower than this many seconds
+                           do not increase the limit. ``None`` disables the check.
+    :type latency_target: :class:`float`
+
+    Usage:
+        >>> from googletrans.concurrency import AdaptiveLimiter
+        >>> translator = Translator(concurrency_limiter=AdaptiveLimiter(max_limit=32))
+        >>> translator.concurrency_limiter.stats()
+        {'limit': 2, 'in_flight': 0, 'successes': 0, 'failures': 0}
+    """
+
+    def __init__(
+        self,
+        initial: int = 2,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        latency_target: typing.Optional[float] = None,
+    ):
+        if not 1 <= min_limit <= initial <= max_limit:
+            raise ValueError("expected 1 <= min_limit <= initial <= max_limit")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_target = latency_target
+
+        self.successes = 0
+        self.failures = 0
+
+        self._limit = float(initial)
+        self._in_flight = 0
+        self._waiters: typing.Deque[asyncio.Future] = collections.deque()
+        self._last_decrease = 0.0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def acquire(self) -> None:
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # the slot was granted right before the cancellation
+                self.release()
+            raise
+
+    def release(self) -> None:
+        self._in_flight -= 1
+        self._wake()
+
+    async def __aenter__(self) -> "AdaptiveLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.release()
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+    def record(self, latency: float, ok: bool) -> None:
+        """Feed the outcome of a request back into the limiter
+
+        :param latency: duration of the request in seconds.
+        :param ok: `False` for throttling (429), server errors (5xx) and timeouts.
+        """
+        if ok:
+            self.successes += 1
+            if self.latency_target is None or latency <= self.latency_target:
+                self._limit = min(
+                    float(self.max_limit), self._limit + self.increase / self._limit
+                )
+                self._wake()
+            return
+
+        self.failures += 1
+        now = time.monotonic()
+        # back off at most once per round trip so a burst of failures from
+        # the same window does not collapse the limit
+        if now - self._last_decrease >= latency:
+            self._last_decrease = now
+            self._limit = max(float(self.min_limit), self._limit * self.decrease)
+
+    def stats(self) -> typing.Dict[str, int]:
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "successes": self.successes,
+            "failures": self.failures,
+        }
@@ -459,6 +459,14 @@ LANGUAGES = {
 
 LANGCODES = {v: k for k, v in LANGUAGES.items()}
 DEFAULT_RAISE_EXCEPTION = False
+
+# response parts (``dt`` parameter) requested for each ``fields`` level
+DT_FIELDS = {
+    "text": ("t",),
+    "pronunciation": ("t", "rm"),
+    "full": ("at", "bd", "ex", "ld", "md", "qca", "rw", "rm", "ss", "t"),
+}
+DEFAULT_FIELDS = "full"
 DUMMY_DATA = [
     [["", None, None, 0]],
     None,
@@ -0,0 +1,202 @@
+"""
+Offline language detection.
+
+Many scripts are used by a single language (Hangul, Kana, Greek, Thai...)
+or by a few languages that can be told apart by their letters (Cyrillic,
+Arabic). :class:`LocalDetector` recognizes those from the characters of
+the text alone, so :meth:`googletrans.Translator.detect` only has to ask
+the service about ambiguous text, such as text written in Latin script.
+"""
+
+import bisect
+import typing
+
+# (first code point, last code point, script)
+_RANGES = sorted(
+    [
+        (0x0370, 0x03FF, "greek"),
+        (0x1F00, 0x1FFF, "greek"),
+        (0x0400, 0x052F, "cyrillic"),
+        (0x0530, 0x058F, "armenian"),
+        (0x0590, 0x05FF, "hebrew"),
+        (0xFB1D, 0xFB4F, "hebrew"),
+        (0x0600, 0x06FF, "arabic"),
+        (0x0750, 0x077F, "arabic"),
+        (0xFB50, 0xFDFF, "arabic"),
+        (0xFE70, 0xFEFF, "arabic"),
+        (0x0780, 0x07BF, "thaana"),
+        (0x0900, 0x097F, "devanagari"),
+        (0x0980, 0x09FF, "bengali"),
+        (0x0A00, 0x0A7F, "gurmukhi"),
+        (0x0A80, 0x0AFF, "gujarati"),
+        (0x0B00, 0x0B7F, "oriya"),
+        (0x0B80, 0x0BFF, "tamil"),
+        (0x0C00, 0x0C7F, "telugu"),
+        (0x0C80, 0x0CFF, "kannada"),
+        (0x0D00, 0x0D7F, "malayalam"),
+        (0x0D80, 0x0DFF, "sinhala"),
+        (0x0E00, 0x0E7F, "thai"),
+        (0x0E80, 0x0EFF, "lao"),
+        (0x0F00, 0x0FFF, "tibetan"),
+        (0x1000, 0x109F, "myanmar"),
+        (0x10A0, 0x10FF, "georgian"),
+        (0x1100, 0x11FF, "hangul"),
+        (0x3130, 0x318F, "hangul"),
+        (0xAC00, 0xD7AF, "hangul"),
+        (0x1200, 0x139F, "ethiopic"),
+        (0x1780, 0x17FF, "khmer"),
+        (0x1800, 0x18AF, "mongolian"),
+        (0x3040, 0x30FF, "kana"),
+        (0x31F0, 0x31FF, "kana"),
+        (0xFF66, 0xFF9F, "kana"),
+        (0x3400, 0x4DBF, "han"),
+        (0x4E00, 0x9FFF, "han"),
+        (0xF900, 0xFAFF, "han"),
+    ]
+)
+_STARTS = [start for start, _, _ in _RANGES]
+
+# script -> (language, confidence, markers). A marker lists groups of letters
+# that are all found in text of one language of the script; the first marker
+# whose groups all occur in the text wins, otherwise the script's default
+# language is used. Letters shared by several languages get a confidence
+# below the default threshold, so such text is left to the service.
+_Markers = typing.Tuple[typing.Tuple[typing.Tuple[str, ...], str, float], ...]
+_SCRIPTS: typing.Dict[str, typing.Tuple[str, float, _Markers]] = {
+    "hangul": ("ko", 1.0, ()),
+    "kana": ("ja", 1.0, ()),
+    "han": ("zh-cn", 0.6, ()),
+    "greek": ("el", 1.0, ()),
+    "armenian": ("hy", 1.0, ()),
+    "georgian": ("ka", 1.0, ()),
+    "thai": ("th", 1.0, ()),
+    "lao": ("lo", 1.0, ()),
+    "khmer": ("km", 1.0, ()),
+    "thaana": ("dv", 1.0, ()),
+    "gurmukhi": ("pa", 1.0, ()),
+    "gujarati": ("gu", 1.0, ()),
+    "oriya": ("or", 1.0, ()),
+    "tamil": ("ta", 1.0, ()),
+    "telugu": ("te", 1.0, ()),
+    "malayalam": ("ml", 1.0, ()),
+    "sinhala": ("si", 1.0, ()),
+    "kannada": ("kn", 0.95, ()),
+    "myanmar": ("my", 0.9, ()),
+    "mongolian": ("mn", 0.9, ()),
+    "tibetan": ("bod", 0.8, ()),
+    "ethiopic": ("am", 0.7, ()),
+    "hebrew": ("iw", 0.95, ((("װױײ",), "yi", 0.95),)),
+    "bengali": ("bn", 0.9, ((("ৰৱ",), "as", 0.9),)),
+    "devanagari": ("hi", 0.6, ((("ळ",), "mr", 0.7),)),
+    "cyrillic": (
+        "ru",
+        0.7,
+        (
+            (("ђћџЂЋЏ",), "sr", 0.95),
+            (("ѓќѕЃЌЅ",), "mk", 0.95),
+            (("јљњЈЉЊ",), "sr", 0.85),
+            (("ӣӯҳҷӢӮҲҶ",), "tg", 0.95),
+            (("ҙҡҫҘҠҪ",), "bak", 0.9),
+            (("җҖ",), "tt", 0.9),
+            (("ғқұҒҚҰ",), "kk", 0.9),
+            # used by Kazakh, Kyrgyz, Tatar, Bashkir and Mongolian alike
+            (("әһңөүӘҺҢӨҮ",), "kk", 0.5),
+            (("ўЎ",), "be", 0.95),
+            (("іІ", "ыЫ"), "be", 0.9),
+            (("їєґЇЄҐ",), "uk", 0.95),
+            (("іІ",), "uk", 0.9),
+            # the languages above that share these letters have been ruled out
+            (("ыэёЫЭЁ", "иъщИЪЩ"), "ru", 0.95),
+            # also written in the languages above, but not only there
+            (("ыэёЫЭЁ",), "ru", 0.85),
+        ),
+    ),
+    "arabic": (
+        "ar",
+        0.9,
+        (
+            (("ٹڈڑںےۓ",), "ur", 0.9),
+            (("ټډړږښګڼ",), "ps", 0.9),
+            (("ڵڕێ",), "ckb", 0.9),
+            (("ۇۈۋ",), "ug", 0.9),
+            (("ڄڃڇڏڙڦڻڪ",), "sd", 0.9),
+            (("پچژگکی",), "fa", 0.85),
+        ),
+    ),
+}
+
+#: only the beginning of long texts is looked at
+SAMPLE_CHARS = 512
+
+
+def _script(char: str) -> typing.Optional[str]:
+    code = ord(char)
+    index = bisect.bisect_right(_STARTS, code) - 1
+    if index >= 0:
+        start, end, script = _RANGES[index]
+        if code <= end:
+            return script
+    return None
+
+
+class LocalDetector:
+    """Script-based language detector
+
+    :param threshold: minimum confidence for :meth:`detect` to answer. Text
+                      below it (and text in Latin script) is left to the service.
+    :type threshold: :class:`float`
+
+    Usage:
+        >>> from googletrans.detection import LocalDetector
+        >>> translator = Translator(local_detector=LocalDetector(threshold=0.9))
+        >>> await translator.detect('이 문장은 한글로 쓰여졌습니다.')
+        <Detected lang=ko confidence=1.0>
+    """
+
+    def __init__(self, threshold: float = 0.9):
+        self.threshold = threshold
+
+    def guess(self, text: str) -> typing.Tuple[typing.Optional[str], float]:
+        """Return the most likely language of ``text`` and the confidence,
+        or ``(None, 0.0)`` if the script gives no clue."""
+        sample = text[:SAMPLE_CHARS]
+        counts: typing.Dict[typing.Optional[str], int] = {}
+        letters = 0
+        for char in sample:
+            if char.isalpha():
+                letters += 1
+                script = _script(char)
+                counts[script] = counts.get(script, 0) + 1
+
+        if not letters:
+            return None, 0.0
+
+        # Han characters are also written in Japanese and Korean text
+        han = counts.pop("han", 0)
+        if counts.get("kana"):
+            counts["kana"] += han
+        elif counts.get("hangul"):
+            counts["hangul"] += han
+        elif han:
+            counts["han"] = han
+
+        script, count = max(counts.items(), key=lambda item: item[1])
+        if script is None:
+            return None, 0.0
+
+        language, confidence, markers = _SCRIPTS[script]
+        chars = set(sample) if markers else set()
+        for groups, marked_language, marked_confidence in markers:
+            if all(not chars.isdisjoint(group) for group in groups):
+                language, confidence = marked_language, marked_confidence
+                break
+
+        return language, confidence * count / letters
+
+    def detect(self, text: str) -> typing.Optional[typing.Tuple[str, float]]:
+        """Return ``(language, confidence)`` if the confidence reaches the
+        threshold, otherwise ``None``."""
+        language, confidence = self.guess(text)
+        if language is None or confidence < self.threshold:
+            return None
+        return language, confidence
@@ -0,0 +1,371 @@
+"""
+Translation of structured localization files.
+
+:class:`DocumentTranslator` walks JSON trees, YAML documents (with the
+optional ``PyYAML`` package), gettext ``.po`` catalogs and XLIFF files,
+collects every translatable string, translates each distinct string once
+in packed concurrent batches and writes the translations back into the
+same structure.
+"""
+
+import json
+import os
+import re
+import typing
+import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape
+
+from googletrans import utils
+from googletrans.client import Translator
+from googletrans.manifest import Manifest
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+
+_EXTENSIONS = (".json", ".yaml", ".yml", ".po", ".pot", ".xlf", ".xliff")
+
+
+def _require_yaml() -> None:
+    if yaml is None:
+        raise ImportError("PyYAML is required: pip install pyyaml")
+
+
+class DocumentTranslator:
+    """Translator for structured documents
+
+    :param translator: translator the strings are sent through.
+    :type translator: :class:`googletrans.Translator`
+
+    :param pack_size: number of short strings packed into one request.
+    :type pack_size: :class:`int`
+
+    :param protect: mask markup and placeholders while translating
+                    (see :mod:`googletrans.masking`).
+    :type protect: boolean
+
+    :param overwrite: translate ``.po`` and XLIFF entries that already have a
+                      translation. By default only missing ones are filled in.
+    :type overwrite: boolean
+
+    :param manifest: translations of earlier runs. Strings found in it are not sent
+                     again, and new translations are added to it. With ``overwrite=True``,
+                     a changed file is re-translated incrementally.
+    :type manifest: :class:`googletrans.manifest.Manifest`
+
+    Usage:
+        >>> from googletrans.documents import DocumentTranslator
+        >>> async with Translator() as translator:
+        ...     documents = DocumentTranslator(translator)
+        ...     await documents.translate_file('messages.json', dest='ko', output='messages.ko.json')
+    """
+
+    def __init__(
+        self,
+        translator: Translator,
+        pack_size: int = 8,
+        protect: bool = True,
+        overwrite: bool = False,
+        manifest: typing.Optional[Manifest] = None,
+    ):
+        self.translator = translator
+        self.pack_size = pack_size
+        self.protect = protect
+        self.overwrite = overwrite
+        self.manifest = manifest
+
+    async def translate_strings(
+        self, strings: typing.Iterable[str], dest: str, src: str = "auto"
+    ) -> typing.Dict[str, str]:
+        """Translate every distinct translatable string once
+
+        :return: a mapping of the translatable strings to their translations
+        """
+        unique = [s for s in dict.fromkeys(strings) if utils.is_translatable(s)]
+
+        translations: typing.Dict[str, str] = {}
+        pending = unique
+        if self.manifest is not None:
+            pending = []
+            for text in unique:
+                translation = self.manifest.get(text, src, dest)
+                if translation is None:
+                    pending.append(text)
+                else:
+                    translations[text] = translation
+
+        if not pending:
+            return translations
+
+        results = await self.translator.translate(
+            pending,
+            dest=dest,
+            src=src,
+            list_operation_pack_size=self.pack_size,
+            protect=self.protect,
+        )
+        for text, result in zip(pending, results):
+            translations[text] = result.text
+            # without raise_exception, failed requests come back untranslated
+            failed = result.status is not None and result.status != 200
+            if self.manifest is not None and not failed:
+                self.manifest.set(text, src, dest, result.text)
+        return translations
+
+    async def translate_json(
+        self, data: typing.Any, dest: str, src: str = "auto"
+    ) -> typing.Any:
+        """Translate the string values of a JSON-like tree. Keys are kept."""
+        strings: typing.List[str] = []
+        _collect(data, strings)
+        translations = await self.translate_strings(strings, dest, src)
+        return _rebuild(data, translations)
+
+    async def translate_yaml(self, text: str, dest: str, src: str = "auto") -> str:
+        """Translate the string values of a YAML document"""
+        _require_yaml()
+        data = await self.translate_json(yaml.safe_load(text), dest, src)
+        return yaml.safe_dump(data, allow_unicode=True, sort_keys=False)
+
+    async def translate_po(self, text: str, dest: str, src: str = "auto") -> str:
+        """Fill in the ``msgstr`` of a gettext catalog"""
+        lines = text.splitlines()
+        entries = [
+            entry
+            for entry in _parse_po(lines)
+            if entry.msgid and (self.overwrite or not any(entry.msgstr.values()))
+        ]
+        strings = [entry.msgid for entry in entries]
+        strings += [entry.msgid_plural for entry in entries if entry.msgid_plural]
+        translations = await self.translate_strings(strings, dest, src)
+
+        replaced: typing.Dict[int, typing.List[str]] = {}
+        removed: typing.Set[int] = set()
+        for entry in entries:
+            singular = translations.get(entry.msgid)
+            if singular is None:
+                continue
+            plural = translations.get(entry.msgid_plural or "", singular)
+            block = []
+            for key in entry.msgstr:
+                value = singular if key in ("msgstr", "msgstr[0]") else plural
+                block.append('{} "{}"'.format(key, _po_escape(value)))
+            first, *rest = entry.msgstr_lines
+            replaced[first] = block
+            removed.update(rest)
+
+        output: typing.List[str] = []
+        for index, line in enumerate(lines):
+            if index in replaced:
+                output.extend(replaced[index])
+            elif index not in removed:
+                output.append(line)
+        return "\n".join(output) + ("\n" if text.endswith("\n") else "")
+
+    async def translate_xliff(self, text: str, dest: str, src: str = "auto") -> str:
+        """Add ``<target>`` elements to the units of an XLIFF 1.2 or 2.0 file"""
+        parser = ET.XMLParser(target=ET.TreeBuilder(insert_comments=True))
+        root = ET.fromstring(text, parser=parser)
+        namespace = root.tag[1:].split("}")[0] if root.tag.startswith("{") else ""
+        if namespace:
+            ET.register_namespace("", namespace)
+
+        def tag(name: str) -> str:
+            return "{%s}%s" % (namespace, name) if namespace else name
+
+        units = []
+        for unit in root.iter():
+            if unit.tag not in (tag("trans-unit"), tag("segment")):
+                continue
+            source = unit.find(tag("source"))
+            target = unit.find(tag("target"))
+            if source is None:
+                continue
+            if target is not None and not self.overwrite and "".join(target.itertext()):
+                continue
+            units.append((unit, source, target, _inner_xml(source)))
+
+        translations = await self.translate_strings(
+            [content for _, _, _, content in units], dest, src
+        )
+
+        for unit, source, target, content in units:
+            translated = translations.get(content)
+            if translated is None:
+                continue
+            if target is None:
+                target = ET.Element(tag("target"))
+                # indent the new element like the source
+                target.tail = source.tail
+                if unit.text is not None and not unit.text.strip():
+                    source.tail = unit.text
+                unit.insert(list(unit).index(source) + 1, target)
+            _set_inner_xml(target, translated, namespace)
+
+        if root.get("version", "").startswith("2"):
+            root.set("trgLang", dest)
+        for file in root.iter(tag("file")):
+            if "source-language" in file.attrib:
+                file.set("target-language", dest)
+
+        return ET.tostring(root, encoding="unicode", xml_declaration=True)
+
+    async def translate_file(
+        self,
+        path: str,
+        dest: str,
+        src: str = "auto",
+        output: typing.Optional[str] = None,
+    ) -> str:
+        """Translate a ``.json``, ``.yaml``/``.yml``, ``.po``/``.pot`` or
+        ``.xlf``/``.xliff`` file, chosen by its extension
+
+        :param output: where to write the translated document. Nothing is
+                       written when omitted. The manifest, if it has a path,
+                       is saved as well.
+        :return: the translated document
+        """
+        extension = os.path.splitext(path)[1].lower()
+        if extension not in _EXTENSIONS:
+            raise ValueError("unsupported document type: {}".format(path))
+
+        with open(path, encoding="utf-8") as f:
+            text = f.read()
+
+        if extension == ".json":
+            translated = json.dumps(
+                await self.translate_json(json.loads(text), dest, src),
+                ensure_ascii=False,
+                indent=2,
+            )
+        elif extension in (".yaml", ".yml"):
+            translated = await self.translate_yaml(text, dest, src)
+        elif extension in (".po", ".pot"):
+            translated = await self.translate_po(text, dest, src)
+        else:
+            translated = await self.translate_xliff(text, dest, src)
+
+        if output is not None:
+            with open(output, "w", encoding="utf-8") as f:
+                f.write(translated)
+        if self.manifest is not None and self.manifest.path is not None:
+            self.manifest.save()
+        return translated
+
+
+def _collect(node: typing.Any, strings: typing.List[str]) -> None:
+    if isinstance(node, str):
+        strings.append(node)
+    elif isinstance(node, dict):
+        for value in node.values():
+            _collect(value, strings)
+    elif isinstance(node, list):
+        for value in node:
+            _collect(value, strings)
+
+
+def _rebuild(node: typing.Any, translations: typing.Dict[str, str]) -> typing.Any:
+    if isinstance(node, str):
+        return translations.get(node, node)
+    if isinstance(node, dict):
+        return {key: _rebuild(value, translations) for key, value in node.items()}
+    if isinstance(node, list):
+        return [_rebuild(value, translations) for value in node]
+    return node
+
+
+class _PoEntry:
+    __slots__ = ("msgid", "msgid_plural", "msgstr", "msgstr_lines")
+
+    def __init__(self) -> None:
+        self.msgid = ""
+        self.msgid_plural: typing.Optional[str] = None
+        self.msgstr: typing.Dict[str, str] = {}
+        self.msgstr_lines: typing.List[int] = []
+
+
+_PO_KEYWORD = re.compile(
+    r'^(msgctxt|msgid_plural|msgid|msgstr(?:\[\d+\])?)\s+"(.*)"\s*$'
+)
+_PO_CONTINUATION = re.compile(r'^"(.*)"\s*$')
+_PO_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", '"': '"', "\\": "\\"}
+_PO_ESCAPE = re.compile(r"\\(.)")
+
+
+def _po_unescape(value: str) -> str:
+    return _PO_ESCAPE.sub(lambda m: _PO_ESCAPES.get(m.group(1), m.group(0)), value)
+
+
+def _po_escape(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\")
+        .replace('"', '\\"')
+        .replace("\n", "\\n")
+        .replace("\t", "\\t")
+        .replace("\r", "\\r")
+    )
+
+
+def _parse_po(lines: typing.List[str]) -> typing.List[_PoEntry]:
+    """Split a catalog into entries, remembering where their ``msgstr`` lines are.
+    Obsolete (``#~``) entries are comments and are skipped."""
+    entries: typing.List[_PoEntry] = []
+    entry: typing.Optional[_PoEntry] = None
+    field: typing.Optional[str] = None
+
+    for index, line in enumerate(lines):
+        stripped = line.strip()
+        keyword = _PO_KEYWORD.match(stripped)
+        if keyword:
+            field, value = keyword.group(1), _po_unescape(keyword.group(2))
+            if entry is None or (field in ("msgctxt", "msgid") and entry.msgstr):
+                entry = _PoEntry()
+                entries.append(entry)
+            if field == "msgid":
+                entry.msgid = value
+            elif field == "msgid_plural":
+                entry.msgid_plural = value
+            elif field.startswith("msgstr"):
+                entry.msgstr[field] = value
+                entry.msgstr_lines.append(index)
+            continue
+
+        continuation = _PO_CONTINUATION.match(stripped)
+        if continuation and entry is not None and field is not None:
+            value = _po_unescape(continuation.group(1))
+            if field == "msgid":
+                entry.msgid += value
+            elif field == "msgid_plural":
+                entry.msgid_plural = (entry.msgid_plural or "") + value
+            elif field.startswith("msgstr"):
+                entry.msgstr[field] += value
+                entry.msgstr_lines.append(index)
+            continue
+
+        # comments and blank lines end the current field
+        field = None
+        if not stripped and entry is not None and entry.msgstr:
+            entry = None
+
+    return [entry for entry in entries if entry.msgstr_lines]
+
+
+def _inner_xml(element: ET.Element) -> str:
+    return escape(element.text or "") + "".join(
+        ET.tostring(child, encoding="unicode") for child in element
+    )
+
+
+def _set_inner_xml(element: ET.Element, content: str, namespace: str) -> None:
+    for child in list(element):
+        element.remove(child)
+    xmlns = ' xmlns="{}"'.format(namespace) if namespace else ""
+    try:
+        fragment = ET.fromstring("<fragment{}>{}</fragment>".format(xmlns, content))
+    except ET.ParseError:
+        element.text = content
+        return
+    element.text = fragment.text
+    element.extend(list(fragment))
@@ -0,0 +1,42 @@
+"""Exceptions raised by googletrans"""
+
+import typing
+
+from httpx import Response
+
+
+class GoogletransError(Exception):
+    """Base class of all googletrans errors"""
+
+
+class RequestError(GoogletransError):
+    """The translation service answered with an unexpected status code
+
+    :param response: the response received.
+    """
+
+    def __init__(self, message: str, response: Response):
+        super().__init__(message)
+        self.response = response
+        self.status_code = response.status_code
+
+
+class TooManyRequests(RequestError):
+    """The translation service throttled the client (HTTP 429)
+
+    :param retry_after: seconds to wait as announced by the ``Retry-After``
+                        header, if any.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        response: Response,
+        retry_after: typing.Optional[float] = None,
+    ):
+        super().__init__(message, response)
+        self.retry_after = retry_after
+
+
+class ServiceUnavailable(RequestError):
+    """The translation service failed with a server error (HTTP 5xx)"""
@@ -1,15 +1,189 @@
 # -*- coding: utf-8 -*-
 import ast
+import asyncio
+import functools
 import math
+import os
 import re
+import tempfile
 import time
-from typing import Any, Callable, Dict, List
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
 
 import httpx
 
 from googletrans.utils import rshift
 
 
+def current_hour() -> int:
+    """the hour stamp a valid tkk starts with"""
+    return math.floor(int(time.time() * 1000) / 3600000.0)
+
+
+def is_current_tkk(tkk: str) -> bool:
+    try:
+        return bool(tkk) and int(tkk.split(".")[0]) == current_hour()
+    except ValueError:
+        return False
+
+
+class SeedStore:
+    """Base class for persisting the seed between processes"""
+
+    def load(self) -> Optional[str]:
+        raise NotImplementedError
+
+    def save(self, tkk: str) -> None:
+        raise NotImplementedError
+
+
+class FileSeedStore(SeedStore):
+    """Keeps the seed in a small file shared by every process of the user
+
+    The seed carries its own hour stamp, so a stale file is simply ignored.
+    Read and write errors are ignored as well; the seed is fetched from the
+    host page then.
+
+    :param path: file to use. Defaults to ``$XDG_CACHE_HOME/googletrans/tkk``
+                 (``~/.cache/googletrans/tkk``).
+    :type path: :class:`str`
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        if path is None:
+            cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+                os.path.expanduser("~"), ".cache"
+            )
+            path = os.path.join(cache_home, "googletrans", "tkk")
+        self.path = path
+
+    def load(self) -> Optional[str]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return f.read().strip() or None
+        except OSError:
+            return None
+
+    def save(self, tkk: str) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            # write to a temporary file first so readers never see half a seed
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(self.path) or ".")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(tkk)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+
+
+class SeedManager:
+    """Shared holder of the hourly TKK seed
+
+    Refreshes are single-flight: when the seed expires, one request fetches
+    the new seed and every other coroutine of the same event loop waits for
+    it instead of sending its own request. Shortly before the hour boundary
+    a background refresh is scheduled for the rollover, so the next seed is
+    usually in place before anybody needs it.
+
+    :param refresh_margin: seconds before the hour boundary from which the
+                           rollover refresh is scheduled.
+    :type refresh_margin: :class:`float`
+
+    :param retry_interval: seconds to wait before fetching again when the
+                           host page did not contain a seed.
+    :type retry_interval: :class:`float`
+
+    :param store: optional store the seed is loaded from before fetching it
+                  and saved to afterwards, e.g. :class:`FileSeedStore`.
+    :type store: :class:`SeedStore`
+    """
+
+    def __init__(
+        self,
+        refresh_margin: float = 30.0,
+        retry_interval: float = 60.0,
+        store: Optional[SeedStore] = None,
+    ):
+        self.tkk = "0"
+        self.store = store
+        self.refresh_margin = refresh_margin
+        self.retry_interval = retry_interval
+        self.fetches = 0
+        self._retry_at = 0.0
+        self._inflight: Dict[asyncio.AbstractEventLoop, "asyncio.Task[None]"] = {}
+        self._scheduled: Dict[asyncio.AbstractEventLoop, "asyncio.Task[None]"] = {}
+
+    async def get(self, fetch: Callable[[], Awaitable[Optional[str]]]) -> str:
+        """Return the current seed, calling ``fetch`` only if it expired"""
+        if is_current_tkk(self.tkk):
+            self._schedule_rollover(fetch)
+            return self.tkk
+
+        if time.monotonic() < self._retry_at:
+            return self.tkk
+
+        if self.store is not None:
+            stored = self.store.load()
+            if stored and is_current_tkk(stored):
+                self.tkk = stored
+                return self.tkk
+
+        await self.refresh(fetch)
+        return self.tkk
+
+    async def refresh(self, fetch: Callable[[], Awaitable[Optional[str]]]) -> None:
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(loop)
+        if task is None:
+            task = loop.create_task(self._fetch(fetch))
+            self._inflight[loop] = task
+            task.add_done_callback(lambda _: self._inflight.pop(loop, None))
+        # a cancelled waiter must not cancel the refresh shared with others
+        await asyncio.shield(task)
+
+    async def _fetch(self, fetch: Callable[[], Awaitable[Optional[str]]]) -> None:
+        self.fetches += 1
+        tkk = await fetch()
+        if tkk:
+            self.tkk = tkk
+            self._retry_at = 0.0
+            if self.store is not None:
+                self.store.save(tkk)
+        else:
+            self._retry_at = time.monotonic() + self.retry_interval
+
+    def rollover_due(self) -> bool:
+        """Tell whether the hour boundary is within ``refresh_margin``"""
+        return (current_hour() + 1) * 3600.0 - time.time() <= self.refresh_margin
+
+    def _schedule_rollover(self, fetch: Callable[[], Awaitable[Optional[str]]]) -> None:
+        if not self.rollover_due():
+            return
+        remaining = (current_hour() + 1) * 3600.0 - time.time()
+
+        loop = asyncio.get_running_loop()
+        if loop in self._scheduled:
+            return
+
+        async def refresh_at_rollover() -> None:
+            await asyncio.sleep(remaining + 0.5)
+            if not is_current_tkk(self.tkk):
+                await self.refresh(fetch)
+
+        task = loop.create_task(refresh_at_rollover())
+        self._scheduled[loop] = task
+
+        def done(task: "asyncio.Task[None]") -> None:
+            self._scheduled.pop(loop, None)
+            # failures surface again on the next regular refresh
+            if not task.cancelled():
+                task.exception()
+
+        task.add_done_callback(done)
+
+
+DEFAULT_SEED_MANAGER = SeedManager()
+
+
 class TokenAcquirer:
     """Google Translate API token generator
 
@@ -25,7 +199,9 @@ class TokenAcquirer:
     request.
 
     This operation will cause an additional request to get an initial
-    token from translate.google.com.
+    token from translate.google.com. The seed is shared through a
+    :class:`SeedManager`, so acquirers of different translators (and hosts)
+    fetch it only once per hour.
 
     Example usage:
         >>> from googletrans.gtoken import TokenAcquirer
@@ -44,24 +220,31 @@ class TokenAcquirer:
         client: httpx.AsyncClient,
         tkk: str = "0",
         host: str = "translate.google.com",
+        seed_manager: Optional["SeedManager"] = None,
     ) -> None:
         self.client = client
         self.tkk = tkk
+        self.seed_manager = seed_manager or DEFAULT_SEED_MANAGER
         self.host = host if "http" in host else "https://" + host
 
     async def _update(self) -> None:
         """update tkk"""
-        # we don't need to update the base TKK value when it is still valid
-        now = math.floor(int(time.time() * 1000) / 3600000.0)
-        if self.tkk and int(self.tkk.split(".")[0]) == now:
+        # we don't need to update the base TKK value when it is still valid,
+        # but close to the hour boundary the manager schedules the rollover
+        if is_current_tkk(self.tkk) and not self.seed_manager.rollover_due():
             return
 
+        tkk = await self.seed_manager.get(self._fetch)
+        if tkk != "0":
+            self.tkk = tkk
+
+    async def _fetch(self) -> Optional[str]:
+        """fetch the host page and extract the current tkk from it"""
         r = await self.client.get(self.host)
 
         raw_tkk = self.RE_TKK.search(r.text)
         if raw_tkk:
-            self.tkk = raw_tkk.group(1)
-            return
+            return raw_tkk.group(1)
 
         code = self.RE_TKK.search(r.text)
 
@@ -116,7 +299,9 @@ class TokenAcquirer:
             value = eval(clause, dict(__builtin__={}))
             result = "{}.{}".format(n, value)
 
-            self.tkk = result
+            return result
+
+        return None
 
     def _lazy(self, value: Any) -> Callable[[], Any]:
         """like lazy evaluation, this method returns a lambda function that
@@ -137,79 +322,89 @@ class TokenAcquirer:
         return lambda: value
 
     def _xr(self, a: int, b: str) -> int:
-        size_b = len(b)
-        c = 0
-        while c < size_b - 2:
-            d = b[c + 2]
-            d = ord(d[0]) - 87 if "a" <= d else int(d)
-            d = rshift(a, d) if "+" == b[c + 1] else a << d
-            a = a + d & 4294967295 if "+" == b[c] else a ^ d
+        return _run_program(a, _compile_program(b))
 
-            c += 3
-        return a
+    def _seed(self) -> Tuple[int, int]:
+        d = (self.tkk if self.tkk != "0" else "").split(".")
+        if len(d) > 1:
+            return int(d[0]), int(d[1])
+        return 0, 0
 
     def acquire(self, text: str) -> str:
-        a: List[int] = []
-        # Convert text to ints
-        for i in text:
-            val = ord(i)
-            if val < 0x10000:
-                a += [val]
-            else:
-                # Python doesn't natively use Unicode surrogates, so account for those
-                a += [
-                    math.floor((val - 0x10000) / 0x400 + 0xD800),
-                    math.floor((val - 0x10000) % 0x400 + 0xDC00),
-                ]
-
-        b = self.tkk if self.tkk != "0" else ""
-        d = b.split(".")
-        b_val = int(d[0]) if len(d) > 1 else 0
-
-        # assume e means char code array
-        e: List[int] = []
-        g = 0
-        size = len(a)
-        while g < size:
-            l = a[g]  # noqa: E741
-            # just append if l is less than 128(ascii: DEL)
-            if l < 128:
-                e.append(l)
-            # append calculated value if l is less than 2048
-            else:
-                if l < 2048:
-                    e.append(l >> 6 | 192)
-                else:
-                    # append calculated value if l matches special condition
-                    if (
-                        (l & 64512) == 55296
-                        and g + 1 < size
-                        and a[g + 1] & 64512 == 56320
-                    ):
-                        g += 1
-                        l = (  # noqa: E741
-                            65536 + ((l & 1023) << 10) + (a[g] & 1023)
-                        )  # This bracket is important
-                        e.append(l >> 18 | 240)
-                        e.append(l >> 12 & 63 | 128)
-                    else:
-                        e.append(l >> 12 | 224)
-                    e.append(l >> 6 & 63 | 128)
-                e.append(l & 63 | 128)
-            g += 1
-        a_val = b_val
-        for value in e:
-            a_val += value
-            a_val = self._xr(a_val, "+-a^+6")
-        a_val = self._xr(a_val, "+-3^+b+-f")
-        a_val ^= int(d[1]) if len(d) > 1 else 0
-        if a_val < 0:  # pragma: nocover
-            a_val = (a_val & 2147483647) + 2147483648
-        a_val %= 1000000  # int(1E6)
-
-        return "{}.{}".format(a_val, a_val ^ b_val)
+        b_val, key = self._seed()
+        return _token(text, b_val, key)
+
+    def acquire_many(self, texts: Iterable[str]) -> List[str]:
+        """Compute the tokens of many texts with the current seed"""
+        b_val, key = self._seed()
+        return [_token(text, b_val, key) for text in texts]
 
     async def do(self, text: str) -> str:
         await self._update()
         tk = self.acquire(text)
         return tk
+
+    async def do_many(self, texts: Iterable[str]) -> List[str]:
+        await self._update()
+        return self.acquire_many(texts)
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_program(program: str) -> Tuple[Tuple[bool, bool, int], ...]:
+    """Compile a program like "+-a^+6" into (add, right shift, shift) triples.
+
+    Every three characters form one step: ``+`` adds (``^`` xors) the value
+    shifted right (``+``) or left (``-``) by the third character, a base-36
+    digit.
+    """
+    ops = []
+    for c in range(0, len(program) - 2, 3):
+        shift = program[c + 2]
+        ops.append(
+            (
+                program[c] == "+",
+                program[c + 1] == "+",
+                ord(shift) - 87 if "a" <= shift else int(shift),
+            )
+        )
+    return tuple(ops)
+
+
+def _run_program(a: int, ops: Tuple[Tuple[bool, bool, int], ...]) -> int:
+    for add, right, shift in ops:
+        d = rshift(a, shift) if right else a << shift
+        a = a + d & 4294967295 if add else a ^ d
+    return a
+
+
+_FINAL_PROGRAM = _compile_program("+-3^+b+-f")
+
+
+def _utf8(text: str) -> bytes:
+    """Encode like the javascript implementation, which works on UTF-16 code
+    units: surrogate pairs become one 4-byte sequence and lone surrogates
+    are encoded as 3 bytes."""
+    try:
+        return text.encode("utf-8")
+    except UnicodeEncodeError:
+        return (
+            text.encode("utf-16-le", "surrogatepass")
+            .decode("utf-16-le", "surrogatepass")
+            .encode("utf-8", "surrogatepass")
+        )
+
+
+def _token(text: str, b_val: int, key: int) -> str:
+    a = b_val
+    for value in _utf8(text):
+        # inlined "+-a^+6"; a is kept within 32 bits by the mask, so the
+        # unsigned right shift is a plain shift
+        a = (a + value + ((a + value) << 10)) & 4294967295
+        a ^= a >> 6
+    a = _run_program(a, _FINAL_PROGRAM)
+    a ^= key
+    if a < 0:  # pragma: nocover
+        a = (a & 2147483647) + 2147483648
+    a %= 1000000  # int(1E6)
+
+    return "{}.{}".format(a, a ^ b_val)
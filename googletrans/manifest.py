@@ -0,0 +1,95 @@
+"""
+Translation manifests for incremental re-translation.
+
+A :class:`Manifest` maps a content hash of every source string (with its
+source and destination language) to its translation. Kept next to the
+translated resources, it lets :class:`googletrans.documents.DocumentTranslator`
+send only new or changed strings when a file is translated again.
+"""
+
+import json
+import os
+import tempfile
+import typing
+
+from googletrans.cache import make_key
+
+
+class Manifest:
+    """Content hash to translation map, optionally stored in a JSON file
+
+    :param path: file to load the manifest from and :meth:`save` it to.
+                 A missing file starts an empty manifest.
+    :type path: :class:`str`
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: typing.Optional[str] = None):
+        self.path = path
+        self.entries: typing.Dict[str, str] = {}
+        self.hits = 0
+        self.misses = 0
+        self._used: typing.Set[str] = set()
+        if path is not None and os.path.exists(path):
+            self.load()
+
+    @staticmethod
+    def key(text: str, src: str, dest: str) -> str:
+        return make_key(text, src, dest, None)
+
+    def get(self, text: str, src: str, dest: str) -> typing.Optional[str]:
+        key = self.key(text, src, dest)
+        translation = self.entries.get(key)
+        if translation is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._used.add(key)
+        return translation
+
+    def set(self, text: str, src: str, dest: str, translation: str) -> None:
+        key = self.key(text, src, dest)
+        self.entries[key] = translation
+        self._used.add(key)
+
+    def prune(self) -> int:
+        """Drop the entries not looked up or set since the manifest was
+        loaded, i.e. strings removed from the source. Return their number."""
+        stale = [key for key in self.entries if key not in self._used]
+        for key in stale:
+            del self.entries[key]
+        return len(stale)
+
+    def load(self) -> None:
+        with open(typing.cast(str, self.path), encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != self.VERSION:
+            raise ValueError(
+                "unsupported manifest version: {}".format(data.get("version"))
+            )
+        self.entries = dict(data["entries"])
+
+    def save(self) -> None:
+        if self.path is None:
+            raise ValueError("the manifest has no path")
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        # write to a temporary file first so an interrupted run keeps the old manifest
+        fd, tmp = tempfile.mkstemp(dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"version": self.VERSION, "entries": self.entries},
+                    f,
+                    ensure_ascii=False,
+                    indent=0,
+                    sort_keys=True,
+                )
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def stats(self) -> typing.Dict[str, int]:
+        return {"entries": len(self.entries), "hits": self.hits, "misses": self.misses}
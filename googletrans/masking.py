@@ -0,0 +1,66 @@
+"""
+Protection of markup and placeholders.
+
+Before a text is sent, :func:`mask` replaces HTML tags, entities,
+``{placeholders}``, ``%s`` style format specifiers and URLs with short
+numbered tokens such as ``⟦0⟧``, which the service leaves alone. After
+translation, :func:`unmask` puts the original pieces back. Whole templated
+or markup segments can then be sent as single requests, and the tokens are
+shorter than what they replace.
+"""
+
+import re
+import typing
+
+_PROTECTED = re.compile(
+    r"""
+    (?:https?|ftp)://[^\s<>"]+ | www\.[^\s<>"]+
+    | <[^<>]+>
+    | &(?:[a-zA-Z]+|\#\d+|\#x[0-9a-fA-F]+);
+    | \{\{[^{}]*\}\} | \{[^{}]*\}
+    | %(?:\d+\$)?(?:\([^)]*\))?[-#0+]*\d*(?:\.\d+)?[sdifeEgGxXorc](?![A-Za-z])
+    """,
+    re.VERBOSE,
+)
+
+# the service sometimes adds spaces inside the brackets
+_TOKEN = re.compile(r"⟦\s*(\d+)\s*⟧")
+
+
+def mask(text: str) -> typing.Tuple[str, typing.List[str]]:
+    """Replace protected pieces of ``text`` with tokens
+
+    :return: the masked text and the protected pieces, the n-th piece being
+             replaced by ``⟦n⟧``
+    """
+    pieces: typing.List[str] = []
+
+    def replace(match: "re.Match[str]") -> str:
+        pieces.append(match.group(0))
+        return "⟦{}⟧".format(len(pieces) - 1)
+
+    return _PROTECTED.sub(replace, text), pieces
+
+
+def unmask(text: str, pieces: typing.Sequence[str]) -> typing.Optional[str]:
+    """Put the pieces replaced by :func:`mask` back into ``text``
+
+    :return: the restored text, or ``None`` if tokens were lost, duplicated or
+             altered beyond recognition
+    """
+    if not pieces:
+        return text
+
+    found: typing.List[int] = []
+
+    def replace(match: "re.Match[str]") -> str:
+        index = int(match.group(1))
+        if index >= len(pieces):
+            return match.group(0)
+        found.append(index)
+        return pieces[index]
+
+    restored = _TOKEN.sub(replace, text)
+    if sorted(found) != list(range(len(pieces))):
+        return None
+    return restored
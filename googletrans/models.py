@@ -1,11 +1,64 @@
-from typing import Optional
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 from httpx import Response
 
+T = TypeVar("T", bound="Base")
+
 
 class Base:
-    def __init__(self, response: Optional[Response] = None):
+    """Base of the result objects
+
+    Results use ``__slots__`` to keep large result sets small, and can be
+    converted to and from plain tuples and dicts (see
+    :mod:`googletrans.serialization` for JSON lines and msgpack).
+    """
+
+    __slots__ = ("_response", "_status")
+
+    #: public fields, in constructor order
+    FIELDS: ClassVar[Tuple[str, ...]] = ()
+
+    def __init__(
+        self, response: Optional[Response] = None, status: Optional[int] = None
+    ):
         self._response = response
+        # HTTP status of the answer, kept even when the response is dropped.
+        # None for results answered from a cache or built locally.
+        if status is None and response is not None:
+            status = response.status_code
+        self._status = status
+
+    @property
+    def status(self) -> Optional[int]:
+        """HTTP status of the answer the result was built from, ``None`` for
+        results answered from a cache or built locally. Without
+        ``raise_exception``, a failed request gives a result holding the
+        input text and the status of the last attempt."""
+        return self._status
+
+    def to_tuple(self, fields: Optional[Sequence[str]] = None) -> Tuple[Any, ...]:
+        return tuple(getattr(self, field) for field in fields or self.FIELDS)
+
+    def to_dict(self, fields: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        return {field: getattr(self, field) for field in fields or self.FIELDS}
+
+    @classmethod
+    def from_tuple(cls: Type[T], values: Sequence[Any]) -> T:
+        return cls(*values)
+
+    @classmethod
+    def from_dict(cls: Type[T], data: Dict[str, Any]) -> T:
+        return cls(**data)
 
 
 class Translated(Base):
@@ -16,16 +69,34 @@ class Translated(Base):
     :param origin: original text
     :param text: translated text
     :param pronunciation: pronunciation
+    :param extra_data: the other parts of the response
+    :param loader: callable returning ``(pronunciation, extra_data)``; when
+                   given, both are computed on first access instead
     """
 
+    __slots__ = (
+        "src",
+        "dest",
+        "origin",
+        "text",
+        "_pronunciation",
+        "_extra_data",
+        "_loader",
+    )
+
+    FIELDS = ("src", "dest", "origin", "text", "pronunciation", "extra_data")
+
     def __init__(
         self,
         src: str,
         dest: str,
         origin: str,
         text: str,
-        pronunciation: str,
+        pronunciation: Optional[str] = None,
         extra_data: Optional[dict] = None,
+        loader: Optional[
+            Callable[[], Tuple[Optional[str], Optional[Dict[str, Any]]]]
+        ] = None,
         **kwargs,
     ):
         super().__init__(**kwargs)
@@ -33,8 +104,34 @@ class Translated(Base):
         self.dest = dest
         self.origin = origin
         self.text = text
-        self.pronunciation = pronunciation
-        self.extra_data = extra_data
+        self._pronunciation = pronunciation
+        self._extra_data = extra_data
+        self._loader = loader
+
+    def _load(self) -> None:
+        if self._loader is not None:
+            loader, self._loader = self._loader, None
+            self._pronunciation, self._extra_data = loader()
+
+    @property
+    def pronunciation(self) -> Optional[str]:
+        self._load()
+        return self._pronunciation
+
+    @pronunciation.setter
+    def pronunciation(self, value: Optional[str]) -> None:
+        self._load()
+        self._pronunciation = value
+
+    @property
+    def extra_data(self) -> Optional[dict]:
+        self._load()
+        return self._extra_data
+
+    @extra_data.setter
+    def extra_data(self, value: Optional[dict]) -> None:
+        self._load()
+        self._extra_data = value
 
     def __str__(self):  # pragma: nocover
         return self.__unicode__()
@@ -54,6 +151,10 @@ class Detected(Base):
     :param confidence: the confidence of detection result (0.00 to 1.00)
     """
 
+    __slots__ = ("lang", "confidence")
+
+    FIELDS = ("lang", "confidence")
+
     def __init__(self, lang: str, confidence: float, **kwargs):
         super().__init__(**kwargs)
         self.lang = lang
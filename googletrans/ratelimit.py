@@ -0,0 +1,106 @@
+"""
+Client-side rate limiting.
+
+A :class:`RateLimiter` smooths the outbound request rate with token buckets
+for requests per second and characters per second. One limiter can be
+shared by several :class:`googletrans.Translator` instances, coroutines and
+even threads running their own event loops.
+"""
+
+import asyncio
+import threading
+import time
+import typing
+
+
+class _Bucket:
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def reserve(self, amount: float, now: float) -> float:
+        """Take ``amount`` tokens and return how long the caller has to wait
+        until the debt is paid back."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= amount
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+
+class RateLimiter:
+    """Token-bucket rate limiter
+
+    :param requests_per_second: sustained request rate. ``None`` disables the budget.
+    :type requests_per_second: :class:`float`
+
+    :param characters_per_second: sustained rate of translated characters.
+                                  ``None`` disables the budget.
+    :type characters_per_second: :class:`float`
+
+    :param request_burst: number of requests that can be sent at once after an
+                          idle period. Defaults to one second worth of requests.
+    :type request_burst: :class:`float`
+
+    :param character_burst: number of characters that can be sent at once after
+                            an idle period. Defaults to one second worth of characters.
+    :type character_burst: :class:`float`
+
+    Usage:
+        >>> from googletrans.ratelimit import RateLimiter
+        >>> limiter = RateLimiter(requests_per_second=5, characters_per_second=5000)
+        >>> first = Translator(rate_limiter=limiter)
+        >>> second = Translator(rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        requests_per_second: typing.Optional[float] = None,
+        characters_per_second: typing.Optional[float] = None,
+        request_burst: typing.Optional[float] = None,
+        character_burst: typing.Optional[float] = None,
+    ):
+        self._buckets: typing.List[typing.Tuple[_Bucket, bool]] = []
+        if requests_per_second:
+            self._buckets.append(
+                (
+                    _Bucket(
+                        requests_per_second,
+                        request_burst or max(1.0, requests_per_second),
+                    ),
+                    False,
+                )
+            )
+        if characters_per_second:
+            self._buckets.append(
+                (
+                    _Bucket(
+                        characters_per_second,
+                        character_burst or characters_per_second,
+                    ),
+                    True,
+                )
+            )
+        self._lock = threading.Lock()
+        self.waited = 0.0
+
+    def reserve(self, characters: int = 0) -> float:
+        """Reserve budget for one request and return the delay in seconds
+        after which it may be sent."""
+        now = time.monotonic()
+        with self._lock:
+            delay = 0.0
+            for bucket, counts_characters in self._buckets:
+                amount = characters if counts_characters else 1
+                delay = max(delay, bucket.reserve(amount, now))
+            self.waited += delay
+        return delay
+
+    async def acquire(self, characters: int = 0) -> None:
+        """Wait until one request carrying ``characters`` characters may be sent"""
+        delay = self.reserve(characters)
+        if delay > 0:
+            await asyncio.sleep(delay)
@@ -0,0 +1,96 @@
+"""
+Retry policy for translation requests.
+
+Transient failures (throttling, server errors and timeouts) are retried with
+exponential backoff and full jitter, honoring the ``Retry-After`` header
+sent by the service.
+"""
+
+import email.utils
+import random
+import time
+import typing
+
+from httpx import Response
+
+
+def parse_retry_after(response: Response) -> typing.Optional[float]:
+    """Return the delay announced by the ``Retry-After`` header in seconds"""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, date.timestamp() - time.time())
+
+
+class RetryPolicy:
+    """Retry configuration for :class:`googletrans.Translator`
+
+    :param max_attempts: total number of attempts, including the first one.
+    :type max_attempts: :class:`int`
+
+    :param backoff_factor: delay before the first retry in seconds; doubled
+                           on every further attempt.
+    :type backoff_factor: :class:`float`
+
+    :param max_backoff: upper bound of a single delay in seconds.
+    :type max_backoff: :class:`float`
+
+    :param jitter: randomize delays between zero and the computed backoff.
+    :type jitter: boolean
+
+    :param retry_statuses: HTTP status codes that are retried.
+
+    :param retry_on_timeout: retry connect/read timeouts.
+    :type retry_on_timeout: boolean
+
+    :param respect_retry_after: wait at least as long as the ``Retry-After``
+                                header asks for (still bounded by ``max_backoff``).
+    :type respect_retry_after: boolean
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        jitter: bool = True,
+        retry_statuses: typing.Collection[int] = (429, 500, 502, 503, 504),
+        retry_on_timeout: bool = True,
+        respect_retry_after: bool = True,
+    ):
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_on_timeout = retry_on_timeout
+        self.respect_retry_after = respect_retry_after
+
+    def can_retry(self, attempt: int) -> bool:
+        return attempt < self.max_attempts
+
+    def should_retry(self, attempt: int, status_code: int) -> bool:
+        return self.can_retry(attempt) and status_code in self.retry_statuses
+
+    def delay(self, attempt: int, response: typing.Optional[Response] = None) -> float:
+        """Seconds to wait after the given (1-based) failed attempt"""
+        backoff = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+        if self.jitter:
+            backoff = random.uniform(0, backoff)
+
+        if self.respect_retry_after and response is not None:
+            retry_after = parse_retry_after(response)
+            if retry_after is not None:
+                backoff = max(backoff, min(retry_after, self.max_backoff))
+
+        return backoff
@@ -0,0 +1,68 @@
+"""
+Serialization of result objects.
+
+Results are written as their field tuples (msgpack) or dicts (JSON lines),
+so large result sets can be stored or shipped between processes without
+copying them into other containers first. The msgpack helpers need the
+optional ``msgpack`` package.
+"""
+
+import json
+import typing
+
+from googletrans.models import Base, Translated
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+T = typing.TypeVar("T", bound=Base)
+
+
+def dump_jsonl(
+    results: typing.Iterable[Base],
+    fp: typing.TextIO,
+    fields: typing.Optional[typing.Sequence[str]] = None,
+) -> None:
+    """Write one JSON object per line
+
+    :param fields: fields to write. Leave out ``extra_data`` to avoid
+                   decoding it for every result.
+    """
+    for result in results:
+        fp.write(json.dumps(result.to_dict(fields), ensure_ascii=False))
+        fp.write("\n")
+
+
+def load_jsonl(
+    fp: typing.Iterable[str],
+    cls: typing.Type[T] = Translated,  # type: ignore[assignment]
+) -> typing.Iterator[T]:
+    """Read results written by :func:`dump_jsonl`"""
+    for line in fp:
+        if line.strip():
+            yield cls.from_dict(json.loads(line))
+
+
+def _require_msgpack() -> None:
+    if msgpack is None:
+        raise ImportError("msgpack is required: pip install msgpack")
+
+
+def packb(
+    results: typing.Iterable[Base],
+    fields: typing.Optional[typing.Sequence[str]] = None,
+) -> bytes:
+    """Pack results into msgpack bytes as a list of field tuples"""
+    _require_msgpack()
+    return msgpack.packb([result.to_tuple(fields) for result in results])
+
+
+def unpackb(
+    data: bytes,
+    cls: typing.Type[T] = Translated,  # type: ignore[assignment]
+) -> typing.List[T]:
+    """Unpack results packed by :func:`packb`"""
+    _require_msgpack()
+    return [cls.from_tuple(values) for values in msgpack.unpackb(data)]
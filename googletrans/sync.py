@@ -0,0 +1,127 @@
+"""
+A blocking facade for :class:`googletrans.Translator`.
+
+The translator itself is async-only. Instead of calling ``asyncio.run`` per
+request, which creates a new connection pool (and TLS/HTTP2 handshake)
+every time, :class:`SyncTranslator` keeps one event loop running in a
+background thread and sends every call through the same translator.
+"""
+
+import asyncio
+import threading
+import typing
+
+from googletrans.client import Translator
+from googletrans.models import Detected, Translated
+
+T = typing.TypeVar("T")
+
+
+class SyncTranslator:
+    """Synchronous wrapper around :class:`googletrans.Translator`
+
+    All keyword arguments are passed to :class:`googletrans.Translator`.
+    The instance is thread-safe: calls from several threads share the same
+    event loop and connection pool.
+
+    Basic usage:
+        >>> from googletrans import SyncTranslator
+        >>> with SyncTranslator() as translator:
+        ...     translator.translate('안녕하세요.').text
+        'Hello.'
+    """
+
+    def __init__(self, **kwargs: typing.Any):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run, name="googletrans-loop", daemon=True
+        )
+        self._thread.start()
+        self._closed = False
+
+        async def create() -> Translator:
+            return Translator(**kwargs)
+
+        self.translator = self._call(create())
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def _call(self, coro: typing.Awaitable[T]) -> T:
+        if self._closed:
+            raise RuntimeError("SyncTranslator is closed")
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def __enter__(self) -> "SyncTranslator":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the connection pool and stop the background event loop"""
+        if self._closed:
+            return
+        self._call(self.translator.__aexit__(None, None, None))
+        self._closed = True
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    @typing.overload
+    def translate(
+        self, text: str, dest: str = ..., src: str = ..., **kwargs: typing.Any
+    ) -> Translated: ...
+
+    @typing.overload
+    def translate(
+        self,
+        text: typing.List[str],
+        dest: str = ...,
+        src: str = ...,
+        **kwargs: typing.Any,
+    ) -> typing.List[Translated]: ...
+
+    def translate(
+        self,
+        text: typing.Union[str, typing.List[str]],
+        dest: str = "en",
+        src: str = "auto",
+        **kwargs: typing.Any,
+    ) -> typing.Union[Translated, typing.List[Translated]]:
+        """See :meth:`googletrans.Translator.translate`"""
+        return self._call(self.translator.translate(text, dest=dest, src=src, **kwargs))
+
+    @typing.overload
+    def detect(self, text: str, **kwargs: typing.Any) -> Detected: ...
+
+    @typing.overload
+    def detect(
+        self, text: typing.List[str], **kwargs: typing.Any
+    ) -> typing.List[Detected]: ...
+
+    def detect(
+        self, text: typing.Union[str, typing.List[str]], **kwargs: typing.Any
+    ) -> typing.Union[Detected, typing.List[Detected]]:
+        """See :meth:`googletrans.Translator.detect`"""
+        return self._call(self.translator.detect(text, **kwargs))
+
+    def translate_stream(
+        self,
+        texts: typing.Iterable[str],
+        dest: str = "en",
+        src: str = "auto",
+        **kwargs: typing.Any,
+    ) -> typing.Iterator[Translated]:
+        """See :meth:`googletrans.Translator.translate_stream`"""
+        stream = self.translator.translate_stream(texts, dest=dest, src=src, **kwargs)
+        try:
+            while True:
+                try:
+                    yield self._call(stream.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            if not self._closed:
+                self._call(stream.aclose())
@@ -4,6 +4,16 @@ import json
 import re
 from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+from googletrans.constants import DT_FIELDS
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError is a subclass of ValueError, like json's
+_loads = orjson.loads if orjson is not None else json.loads
+
 
 def build_params(
     client: str,
@@ -18,7 +28,7 @@ def build_params(
         "sl": src,
         "tl": dest,
         "hl": dest,
-        "dt": ["at", "bd", "ex", "ld", "md", "qca", "rw", "rm", "ss", "t"],
+        "dt": list(DT_FIELDS["full"]),
         "ie": "UTF-8",
         "oe": "UTF-8",
         "otf": 1,
@@ -35,7 +45,161 @@ def build_params(
     return params
 
 
+PACK_DELIMITER = "\n"
+
+
+def pack_segments(
+    texts: List[str], max_items: int, max_chars: int
+) -> Tuple[List[List[int]], List[int]]:
+    """Group list indices into packs that can be sent as a single query.
+
+    Only non-empty, single-line texts are packed since the segments are
+    joined with a newline and split again on the way back. Returns the
+    packs and the indices that have to be translated one by one.
+    """
+    packs: List[List[int]] = []
+    singles: List[int] = []
+    current: List[int] = []
+    size = 0
+
+    for index, text in enumerate(texts):
+        if not text.strip() or PACK_DELIMITER in text or "\r" in text:
+            singles.append(index)
+            continue
+
+        length = len(text) + len(PACK_DELIMITER)
+        if current and (len(current) >= max_items or size + length > max_chars):
+            packs.append(current)
+            current, size = [], 0
+        current.append(index)
+        size += length
+
+    if current:
+        packs.append(current)
+
+    return packs, singles
+
+
+def unpack_segments(text: str, count: int) -> Optional[List[str]]:
+    """Split a packed translation back into its segments.
+
+    Returns ``None`` when the number of segments does not match, which means
+    the alignment was lost and the caller should fall back.
+    """
+    parts = [part.strip() for part in text.split(PACK_DELIMITER)]
+    if len(parts) != count:
+        return None
+    return parts
+
+
+# boundaries tried in order when a text is too long for a single request:
+# paragraphs/lines, then sentences, then words
+_SPLIT_PATTERNS = (
+    re.compile(r"(?<=\n)"),
+    re.compile(r"(?<=[.!?\u2026])(?=\s)|(?<=[\u3002\uff01\uff1f])"),
+    re.compile(r"(?<=\s)(?=\S)"),
+)
+
+
+def _byte_size(text: str) -> int:
+    return len(text.encode("utf-8"))
+
+
+def split_text(text: str, max_bytes: int, _level: int = 0) -> List[str]:
+    """Split a long text into chunks of at most ``max_bytes`` UTF-8 bytes.
+
+    Paragraph boundaries are preferred over sentence boundaries, which are
+    preferred over word boundaries; a single word that is still too long is
+    cut between characters. Joining the chunks gives back the original text.
+    """
+    if _byte_size(text) <= max_bytes:
+        return [text]
+
+    chunks: List[str] = []
+    current = ""
+    size = 0
+
+    if _level >= len(_SPLIT_PATTERNS):
+        for char in text:
+            length = _byte_size(char)
+            if current and size + length > max_bytes:
+                chunks.append(current)
+                current, size = "", 0
+            current += char
+            size += length
+        chunks.append(current)
+        return chunks
+
+    for piece in _SPLIT_PATTERNS[_level].split(text):
+        if not piece:
+            continue
+        length = _byte_size(piece)
+        if length > max_bytes:
+            if current:
+                chunks.append(current)
+                current, size = "", 0
+            chunks.extend(split_text(piece, max_bytes, _level + 1))
+        elif size + length > max_bytes:
+            chunks.append(current)
+            current, size = piece, length
+        else:
+            current += piece
+            size += length
+
+    if current:
+        chunks.append(current)
+
+    return chunks
+
+
+# parts of a text that are never translated: URLs, e-mail addresses, markup,
+# format placeholders and codes mixing letters and digits (SKUs, versions)
+_NON_TRANSLATABLE = re.compile(
+    r"""
+    (?:https?|ftp)://\S+ | www\.\S+ | [\w.+-]+@[\w-]+\.[\w.-]+
+    | <[^<>]*>
+    | \{\{[^{}]*\}\} | \{[^{}]*\} | %(?:\([^)]*\))?[-#0+]*\d*(?:\.\d+)?[sdifeEgGxXorc%](?![A-Za-z])
+    | \b(?=[A-Z0-9_./-]*\d)[A-Z0-9]+(?:[-_./][A-Z0-9]+)+\b
+    | \b[A-Za-z_]*\d[A-Za-z0-9_]*\b
+    """,
+    re.VERBOSE | re.ASCII,
+)
+
+
+def is_translatable(text: str) -> bool:
+    """Tell whether ``text`` has anything to translate.
+
+    Text made only of numbers, URLs, e-mail addresses, markup, placeholders,
+    codes, punctuation and emoji is returned unchanged by the service, so it
+    does not need a request.
+    """
+    if not any(char.isalpha() for char in text):
+        return False
+    return any(char.isalpha() for char in _NON_TRANSLATABLE.sub(" ", text))
+
+
+# a JSON string (returned unchanged) or an array slot left empty, i.e. a "["
+# or "," directly followed by another ","
+_SPARSE_SLOT = re.compile(r'("(?:[^"\\]|\\.)*")|([\[,])(\s*)(?=,)')
+
+
+def _fill_slot(match: "re.Match[str]") -> str:
+    if match.group(1) is not None:
+        return match.group(1)
+    return match.group(2) + match.group(3) + "null"
+
+
+def fill_sparse_arrays(original: str) -> str:
+    """Turn javascript sparse arrays (``[,`` and ``,,``) into valid JSON.
+
+    Runs in a single pass over the text; strings are skipped as a whole, so
+    commas inside them are left alone.
+    """
+    return _SPARSE_SLOT.sub(_fill_slot, original)
+
+
 def legacy_format_json(original: str) -> Dict[str, Any]:
+    """Former fallback parser, superseded by :func:`fill_sparse_arrays`."""
     # save state
     states: List[Tuple[int, str]] = []
     text: str = original
@@ -75,9 +239,9 @@ def get_items(dict_object: Dict[str, Any]) -> Iterator[Tuple[Any, Any]]:
 
 def format_json(original: str) -> Dict[str, Any]:
     try:
-        converted: Dict[str, Any] = json.loads(original)
+        converted: Dict[str, Any] = _loads(original)
     except ValueError:
-        converted = legacy_format_json(original)
+        converted = _loads(fill_sparse_arrays(original))
 
     return converted
 
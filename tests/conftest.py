@@ -1,3 +1,5 @@
+import contextlib
+
 import httpx
 import pytest
 
@@ -14,3 +16,19 @@ async def translator():
 async def acquirer():
     async with httpx.AsyncClient(http2=True) as client:
         yield gtoken.TokenAcquirer(client=client)
+
+
+@pytest.fixture(scope="function")
+async def make_translator():
+    """Build translators whose requests are answered by ``handler``. They and
+    their clients are closed at the end of the test."""
+    async with contextlib.AsyncExitStack() as stack:
+
+        def make(handler, **kwargs) -> Translator:
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            stack.push_async_callback(client.aclose)
+            translator = Translator(client=client, **kwargs)
+            stack.push_async_exit(translator)
+            return translator
+
+        yield make
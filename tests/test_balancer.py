@@ -0,0 +1,113 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from googletrans.balancer import ServiceBalancer
+
+
+def test_prefers_fast_hosts():
+    balancer = ServiceBalancer(["fast", "slow"])
+    balancer.record("fast", 0.05, ok=True)
+    balancer.record("slow", 2.0, ok=True)
+
+    assert {balancer.pick() for _ in range(20)} == {"fast"}
+
+
+def test_explores_unknown_hosts_first():
+    balancer = ServiceBalancer(["a", "b"])
+    balancer.record("a", 0.05, ok=True)
+
+    assert balancer.pick() == "b"
+
+
+def test_ejects_failing_hosts(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("googletrans.balancer.time.monotonic", lambda: now[0])
+    balancer = ServiceBalancer(["good", "bad"], failure_threshold=2, cooldown=10)
+    balancer.record("good", 1.0, ok=True)
+    balancer.record("bad", 0.01, ok=False)
+    balancer.record("bad", 0.01, ok=False)
+
+    assert balancer.stats()["bad"]["ejected"]
+    assert {balancer.pick() for _ in range(20)} == {"good"}
+
+    now[0] += 11
+    assert not balancer.stats()["bad"]["ejected"]
+
+
+@pytest.mark.asyncio
+async def test_translator_reports_to_balancer(make_translator):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "blocked.example":
+            return httpx.Response(503)
+        return httpx.Response(200, text=json.dumps([[["hi", "hi"]], None, "en"]))
+
+    balancer = ServiceBalancer(["ok.example", "blocked.example"], failure_threshold=1)
+    translator = make_translator(
+        handler, service_urls=["ok.example", "blocked.example"], balancer=balancer
+    )
+    translator.client_type = "gtx"
+
+    for _ in range(4):
+        await translator.translate("hi")
+
+    stats = balancer.stats()
+    assert stats["blocked.example"]["requests"] == 1
+    assert stats["ok.example"]["requests"] == 3
+
+
+def test_probes_unknown_host_once():
+    balancer = ServiceBalancer(["a", "b"])
+    balancer.record("a", 0.05, ok=True)
+
+    assert balancer.pick() == "b"
+    # the probe of b is still in flight
+    assert {balancer.pick() for _ in range(20)} == {"a"}
+
+
+@pytest.mark.asyncio
+async def test_connection_errors_eject_host(make_translator):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "refused.example":
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(200, text=json.dumps([[["hi", "hi"]], None, "en"]))
+
+    balancer = ServiceBalancer(["ok.example", "refused.example"], failure_threshold=1)
+    translator = make_translator(
+        handler, service_urls=["ok.example", "refused.example"], balancer=balancer
+    )
+    translator.client_type = "gtx"
+
+    failures = 0
+    for _ in range(10):
+        try:
+            await translator.translate("hi")
+        except httpx.ConnectError:
+            failures += 1
+
+    stats = balancer.stats()
+    assert failures == 1
+    assert stats["refused.example"]["requests"] == 1
+    assert stats["refused.example"]["ejected"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_probe_is_released(make_translator):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "slow.example":
+            await asyncio.sleep(10)
+        return httpx.Response(200, text=json.dumps([[["hi", "hi"]], None, "en"]))
+
+    balancer = ServiceBalancer(["ok.example", "slow.example"])
+    balancer.record("ok.example", 0.05, ok=True)
+    translator = make_translator(
+        handler, service_urls=["ok.example", "slow.example"], balancer=balancer
+    )
+    translator.client_type = "gtx"
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(translator.translate("hi"), 0.01)
+
+    assert balancer.pick() == "slow.example"
@@ -0,0 +1,145 @@
+import asyncio
+
+import httpx
+import pytest
+
+from googletrans.cache import MemoryCache, SQLiteCache, make_key
+
+RESPONSE = '[[["시험","test",null,null,10]],null,"en",null,null,null,1,[],[["en"],null,[1],["en"]]]'
+
+
+def test_make_key_normalizes_input():
+    composed = make_key("é", "auto", "en", {"b": 1, "a": 2})
+    decomposed = make_key("é", "auto", "en", {"a": 2, "b": 1})
+
+    assert composed == decomposed
+    assert composed != make_key("é", "auto", "ko", {"a": 2, "b": 1})
+
+
+def test_memory_cache_lru_eviction():
+    cache = MemoryCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats() == {"hits": 3, "misses": 1}
+
+
+def test_memory_cache_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("googletrans.cache.time.monotonic", lambda: now[0])
+    cache = MemoryCache(ttl=10)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+
+    now[0] += 11
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_sqlite_cache_persists(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    data = [[["시험", "test", None, None, 10]], None, "en"]
+
+    cache = SQLiteCache(path)
+    cache.set("key", data)
+    cache.close()
+
+    reopened = SQLiteCache(path)
+    assert reopened.get("key") == data
+    assert reopened.get("missing") is None
+    assert reopened.stats() == {"hits": 1, "misses": 1}
+
+
+def test_sqlite_cache_eviction(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("googletrans.cache.time.time", lambda: now[0])
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite3"), max_entries=2, max_age=60)
+    for key in "abc":
+        cache.set(key, [key])
+        now[0] += 1
+    cache.prune()
+
+    assert len(cache) == 2
+    assert cache.get("a") is None
+
+    now[0] += 61
+    assert cache.get("c") is None
+
+
+def test_sqlite_cache_max_entries_is_enforced_on_write(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("googletrans.cache.time.time", lambda: now[0])
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite3"), max_entries=2)
+    for key in "abcd":
+        cache.set(key, [key])
+        now[0] += 1
+        assert len(cache) <= 2
+
+    assert cache.get("b") is None
+    assert cache.get("d") == ["d"]
+
+
+@pytest.mark.asyncio
+async def test_translator_cache_hit_skips_request(make_translator):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, text=RESPONSE)
+
+    cache = MemoryCache()
+    translator = make_translator(handler, cache=cache)
+
+    first = await translator.translate("test", dest="ko")
+    second = await translator.translate("test", dest="ko")
+
+    assert first.text == second.text == "시험"
+    assert second._response is None
+    assert len(calls) == 1
+    assert cache.stats() == {"hits": 1, "misses": 1}
+
+
+@pytest.mark.asyncio
+async def test_translate_list_deduplicates(make_translator):
+    queries = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        queries.append(request.url.params["q"])
+        return httpx.Response(200, text=RESPONSE)
+
+    translator = make_translator(handler)
+
+    results = await translator.translate(["test", "other", "test", "test"], dest="ko")
+    detected = await translator.detect(["test", "test"])
+
+    assert sorted(queries) == ["other", "test", "test"]
+    assert [r.origin for r in results] == ["test", "other", "test", "test"]
+    assert results[0] is not results[2]
+    assert results[2].text == "시험"
+    assert [d.lang for d in detected] == ["en", "en"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_one_call(make_translator):
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, text=RESPONSE)
+
+    translator = make_translator(handler)
+
+    results = await asyncio.gather(
+        *[translator.translate("test", dest="ko") for _ in range(5)]
+    )
+
+    assert calls == 1
+    assert {r.text for r in results} == {"시험"}
+    assert translator._in_flight == {}
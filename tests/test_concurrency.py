@@ -0,0 +1,169 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from googletrans import Translator
+from googletrans.concurrency import AdaptiveLimiter
+
+
+def test_limiter_additive_increase_multiplicative_decrease():
+    limiter = AdaptiveLimiter(initial=2, min_limit=1, max_limit=4)
+
+    for _ in range(20):
+        limiter.record(0.1, ok=True)
+    assert limiter.limit == 4
+
+    limiter.record(0.1, ok=False)
+    assert limiter.limit == 2
+    limiter.record(10.0, ok=False)  # same window, no second back-off
+    assert limiter.limit == 2
+    assert limiter.stats() == {
+        "limit": 2,
+        "in_flight": 0,
+        "successes": 20,
+        "failures": 2,
+    }
+
+
+def test_limiter_latency_target():
+    limiter = AdaptiveLimiter(initial=2, latency_target=0.5)
+
+    limiter.record(1.0, ok=True)
+    limiter.record(1.0, ok=True)
+
+    assert limiter.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_limiter_bounds_in_flight():
+    limiter = AdaptiveLimiter(initial=1, max_limit=2)
+    peak = 0
+
+    async def work():
+        nonlocal peak
+        async with limiter:
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*[work() for _ in range(5)])
+
+    assert peak == 1
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_translator_feeds_limiter(make_translator):
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = request.url.params["q"]
+        if query == "throttled":
+            return httpx.Response(429)
+        return httpx.Response(200, text=json.dumps([[[query, query]], None, "en"]))
+
+    limiter = AdaptiveLimiter()
+    translator = make_translator(handler, concurrency_limiter=limiter)
+
+    await translator.translate(["a", "b", "throttled"])
+
+    assert limiter.successes == 2
+    assert limiter.failures == 1
+
+
+@pytest.mark.asyncio
+async def test_max_connections_per_host(make_translator):
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        query = request.url.params["q"]
+        return httpx.Response(200, text=json.dumps([[[query, query]], None, "en"]))
+
+    translator = make_translator(handler, max_connections_per_host=2)
+
+    results = await translator.translate(
+        [str(i) for i in range(8)], list_operation_max_concurrency=8
+    )
+
+    assert [r.text for r in results] == [str(i) for i in range(8)]
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_max_connections_per_host_is_per_client():
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        query = request.url.params["q"]
+        return httpx.Response(200, text=json.dumps([[[query, query]], None, "en"]))
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        translators = [
+            Translator(client=client, max_connections_per_host=2) for _ in range(3)
+        ]
+        await asyncio.gather(
+            *[
+                translator.translate(
+                    [str(i) for i in range(4)], list_operation_max_concurrency=4
+                )
+                for translator in translators
+            ]
+        )
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_shared_client_is_not_closed():
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = request.url.params["q"]
+        return httpx.Response(200, text=json.dumps([[[query, query]], None, "en"]))
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    async with Translator(client=client) as first:
+        await first.translate("a")
+    async with Translator(client=client) as second:
+        assert (await second.translate("b")).text == "b"
+
+    assert not client.is_closed
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_chunked_list_items_with_limiter_do_not_deadlock(make_translator):
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = request.url.params["q"]
+        return httpx.Response(200, text=json.dumps([[[query, query]], None, "en"]))
+
+    limiter = AdaptiveLimiter(initial=2, max_limit=2)
+    translator = make_translator(
+        handler, concurrency_limiter=limiter, max_chunk_bytes=20
+    )
+    texts = [
+        "First sentence. Second sentence. Third sentence.",
+        "Another sentence. And one more. The last one.",
+    ]
+
+    results = await asyncio.wait_for(translator.translate(texts), timeout=5)
+
+    assert [r.text for r in results] == texts
+
+
+@pytest.mark.asyncio
+async def test_default_pool_limits():
+    async with Translator() as translator:
+        pool = translator.client._transport._pool
+
+    assert pool._max_connections == 100
+    assert pool._max_keepalive_connections == 20
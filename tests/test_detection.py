@@ -0,0 +1,134 @@
+import json
+
+import httpx
+import pytest
+
+from googletrans.constants import LANGUAGES
+from googletrans.detection import _SCRIPTS, LocalDetector
+
+
+@pytest.mark.parametrize(
+    "text, lang",
+    [
+        ("이 문장은 한글로 쓰여졌습니다.", "ko"),
+        ("この文章は日本語で書かれました。", "ja"),
+        ("Це речення написане українською.", "uk"),
+        ("Беларусь — гэта краіна ў Еўропе.", "be"),
+        ("Гэта мова мае літары і ы.", "be"),
+        ("Қазақстан Республикасы — мемлекет.", "kk"),
+        ("Это предложение написано по-русски.", "ru"),
+        ("Съешь ещё этих мягких булок.", "ru"),
+        ("Αυτή η πρόταση είναι γραμμένη στα ελληνικά.", "el"),
+        ("ประโยคนี้เขียนเป็นภาษาไทย", "th"),
+        ("هذه الجملة مكتوبة باللغة العربية", "ar"),
+    ],
+)
+def test_detect_unambiguous_scripts(text, lang):
+    detected = LocalDetector().detect(text)
+
+    assert detected is not None
+    assert detected[0] == lang
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Това изречение е написано на български.",  # Bulgarian
+        "Кыргызстан өлкөсү тоолуу.",  # Kyrgyz
+        "Монгол улс бол үзэсгэлэнтэй орон.",  # Mongolian
+        "Татарстан республикасы зур түгел.",  # Tatar
+        "Мин сезне яратам, әни.",  # Tatar
+    ],
+)
+def test_shared_cyrillic_letters_are_not_conclusive(text):
+    language, confidence = LocalDetector().guess(text)
+
+    assert confidence < 0.9
+    assert LocalDetector().detect(text) is None
+
+
+def test_ambiguous_text_is_left_to_the_service():
+    detector = LocalDetector()
+
+    assert detector.detect("This sentence is written in English.") is None
+    assert detector.detect("12345") is None
+    assert detector.guess("中文") == ("zh-cn", 0.6)
+    assert detector.detect("中文") is None
+    assert LocalDetector(threshold=0.5).detect("中文") == ("zh-cn", 0.6)
+
+
+def test_languages_are_known():
+    for language, _, markers in _SCRIPTS.values():
+        assert language in LANGUAGES
+        for _, marked_language, _ in markers:
+            assert marked_language in LANGUAGES
+
+
+@pytest.mark.asyncio
+async def test_translator_uses_local_detector(make_translator):
+    queries = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        queries.append(request.url.params["q"])
+        body = [[["x", "x"]], None, "en", None, None, None, 1, None]
+        body.append([["en"], None, [0.9], ["en"]])
+        return httpx.Response(200, text=json.dumps(body))
+
+    translator = make_translator(handler, local_detector=LocalDetector())
+
+    results = await translator.detect(["안녕하세요", "Hello there"])
+
+    assert [r.lang for r in results] == ["ko", "en"]
+    assert results[0].confidence == 1.0
+    assert queries == ["Hello there"]
+
+
+@pytest.mark.asyncio
+async def test_short_circuit_skips_requests(make_translator):
+    queries = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = request.url.params["q"]
+        queries.append(query)
+        return httpx.Response(
+            200, text=json.dumps([[[query.upper(), query]], None, "en"])
+        )
+
+    translator = make_translator(handler, short_circuit=True)
+
+    results = await translator.translate(
+        ["SKU-1234X", "안녕하세요", "hello", "https://example.com", "bonjour"],
+        dest="ko",
+    )
+    same = await translator.translate("hello", dest="en", src="en")
+
+    assert queries == ["hello", "bonjour"]
+    assert [r.text for r in results] == [
+        "SKU-1234X",
+        "안녕하세요",
+        "HELLO",
+        "https://example.com",
+        "BONJOUR",
+    ]
+    assert results[1].src == "ko"
+    assert results[1].extra_data is None
+    assert same.text == "hello"
+
+
+@pytest.mark.asyncio
+async def test_short_circuit_trusts_explicit_src(make_translator):
+    queries = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = request.url.params["q"]
+        queries.append(query)
+        return httpx.Response(
+            200, text=json.dumps([[[query.upper(), query]], None, "kk"])
+        )
+
+    translator = make_translator(handler, short_circuit=True)
+
+    result = await translator.translate("Привет мир", src="kk", dest="ru")
+
+    assert queries == ["Привет мир"]
+    assert result.text == "ПРИВЕТ МИР"
@@ -0,0 +1,112 @@
+import json
+
+import httpx
+import pytest
+
+from googletrans.documents import DocumentTranslator
+
+PO = """msgid ""
+msgstr ""
+"Language: \\n"
+
+#: app.py:1
+msgid "Hello {name}"
+msgstr ""
+
+msgctxt "menu"
+msgid ""
+"Open "
+"file"
+msgstr ""
+
+msgid "one apple"
+msgid_plural "%d apples"
+msgstr[0] ""
+msgstr[1] ""
+
+msgid "done"
+msgstr "fait"
+"""
+
+XLIFF = """<?xml version="1.0" encoding="UTF-8"?>
+<xliff version="1.2" xmlns="urn:oasis:names:tc:xliff:document:1.2">
+  <file source-language="en" datatype="plaintext" original="app">
+    <body>
+      <trans-unit id="1">
+        <source>Hello <g id="b">world</g></source>
+      </trans-unit>
+      <trans-unit id="2">
+        <source>Bye</source>
+        <target>Au revoir</target>
+      </trans-unit>
+    </body>
+  </file>
+</xliff>"""
+
+
+@pytest.fixture
+def make_documents(make_translator):
+    def make(requests, **kwargs) -> DocumentTranslator:
+        def handler(request: httpx.Request) -> httpx.Response:
+            query = request.url.params["q"]
+            requests.append(query)
+            return httpx.Response(
+                200, text=json.dumps([[[query.upper(), query]], None, "en"])
+            )
+
+        return DocumentTranslator(make_translator(handler), **kwargs)
+
+    return make
+
+
+@pytest.mark.asyncio
+async def test_translate_json_dedups_and_keeps_structure(make_documents):
+    requests = []
+    documents = make_documents(requests)
+
+    data = {"a": "hello", "b": ["hello", "SKU-1", {"c": "world"}], "n": 3}
+    result = await documents.translate_json(data, dest="ko")
+
+    assert result == {"a": "HELLO", "b": ["HELLO", "SKU-1", {"c": "WORLD"}], "n": 3}
+    assert requests == ["hello\nworld"]
+
+
+@pytest.mark.asyncio
+async def test_translate_po(make_documents):
+    requests = []
+    documents = make_documents(requests)
+
+    result = await documents.translate_po(PO, dest="ko")
+
+    assert 'msgstr "HELLO {name}"' in result
+    assert 'msgstr "OPEN FILE"' in result
+    assert 'msgstr[0] "ONE APPLE"\nmsgstr[1] "%d APPLES"' in result
+    assert 'msgid "done"\nmsgstr "fait"' in result
+    assert result.startswith('msgid ""\nmsgstr ""\n"Language: \\n"')
+    assert len(requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_translate_xliff(make_documents):
+    requests = []
+    documents = make_documents(requests)
+
+    result = await documents.translate_xliff(XLIFF, dest="ko")
+
+    assert '<target>HELLO <g id="b">WORLD</g></target>' in result
+    assert "<target>Au revoir</target>" in result
+    assert 'target-language="ko"' in result
+    assert requests == ["Hello ⟦0⟧world⟦1⟧"]
+
+
+@pytest.mark.asyncio
+async def test_translate_file(tmp_path, make_documents):
+    source = tmp_path / "messages.json"
+    source.write_text(json.dumps({"greeting": "hello"}), encoding="utf-8")
+    output = tmp_path / "messages.ko.json"
+
+    await make_documents([]).translate_file(str(source), dest="ko", output=str(output))
+
+    assert json.loads(output.read_text(encoding="utf-8")) == {"greeting": "HELLO"}
+    with pytest.raises(ValueError):
+        await make_documents([]).translate_file(str(source.with_suffix(".txt")), "ko")
@@ -1,5 +1,7 @@
+import asyncio
 from typing import Any, Callable
 
+import httpx
 import pytest
 
 from googletrans import gtoken
@@ -65,3 +67,121 @@ def test_map_lazy_return(acquirer: gtoken.TokenAcquirer) -> None:
 
     assert callable(func)
     assert func() == value
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("test", "950078.567513"),
+        ("Ѐ", "855979.776268"),
+        (chr(55296) + chr(56320), "373016.222975"),
+        (chr(55296) + "x", "212300.387755"),
+        ("가", "326217.142766"),
+        ("hello 😀 world", "306450.162549"),
+        ("", "349507.230052"),
+    ],
+)
+def test_acquire_known_tokens(
+    acquirer: gtoken.TokenAcquirer, text: str, expected: str
+) -> None:
+    acquirer.tkk = "448487.932609646"
+
+    assert acquirer.acquire(text) == expected
+
+
+def test_acquire_many(acquirer: gtoken.TokenAcquirer) -> None:
+    acquirer.tkk = "448487.932609646"
+    texts = ["test", "가", ""]
+
+    assert acquirer.acquire_many(texts) == [acquirer.acquire(t) for t in texts]
+
+
+@pytest.mark.asyncio
+async def test_seed_refresh_is_single_flight() -> None:
+    seed = f"{gtoken.current_hour()}.123"
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, text=f"tkk:'{seed}'")
+
+    manager = gtoken.SeedManager()
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        acquirers = [
+            gtoken.TokenAcquirer(client=client, host=host, seed_manager=manager)
+            for host in ("translate.google.com", "translate.google.co.kr")
+        ]
+        await asyncio.gather(*[a.do("test") for a in acquirers for _ in range(5)])
+
+    assert len(calls) == 1
+    assert manager.fetches == 1
+    assert all(a.tkk == seed for a in acquirers)
+
+
+@pytest.mark.asyncio
+async def test_seed_rollover_is_scheduled() -> None:
+    seed = f"{gtoken.current_hour()}.123"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text=f"tkk:'{seed}'")
+
+    # a margin of more than an hour puts every call close to the boundary
+    manager = gtoken.SeedManager(refresh_margin=10**6)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        acquirer = gtoken.TokenAcquirer(client=client, seed_manager=manager)
+        await acquirer.do("a")
+        assert not manager._scheduled
+        await acquirer.do("b")
+        scheduled = list(manager._scheduled.values())
+        assert len(scheduled) == 1
+        scheduled[0].cancel()
+
+    assert manager.fetches == 1
+
+
+@pytest.mark.asyncio
+async def test_seed_missing_is_not_refetched() -> None:
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, text="no seed here")
+
+    manager = gtoken.SeedManager(retry_interval=60)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        acquirer = gtoken.TokenAcquirer(client=client, seed_manager=manager)
+        await acquirer.do("a")
+        await acquirer.do("b")
+
+    assert len(calls) == 1
+    assert acquirer.tkk == "0"
+
+
+@pytest.mark.asyncio
+async def test_seed_is_persisted(tmp_path) -> None:
+    seed = f"{gtoken.current_hour()}.456"
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, text=f"tkk:'{seed}'")
+
+    store = gtoken.FileSeedStore(str(tmp_path / "seed" / "tkk"))
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        for _ in range(2):
+            # a fresh manager behaves like a new process
+            manager = gtoken.SeedManager(store=store)
+            acquirer = gtoken.TokenAcquirer(client=client, seed_manager=manager)
+            await acquirer.do("test")
+            assert acquirer.tkk == seed
+
+    assert len(calls) == 1
+    assert store.load() == seed
+
+
+def test_stale_seed_is_ignored(tmp_path) -> None:
+    store = gtoken.FileSeedStore(str(tmp_path / "tkk"))
+    store.save(f"{gtoken.current_hour() - 1}.456")
+
+    assert not gtoken.is_current_tkk(store.load())
@@ -0,0 +1,72 @@
+import json
+
+import httpx
+import pytest
+
+from googletrans.documents import DocumentTranslator
+from googletrans.manifest import Manifest
+
+
+def test_manifest_round_trip(tmp_path):
+    path = str(tmp_path / "manifest.json")
+    manifest = Manifest(path)
+    manifest.set("hello", "auto", "ko", "안녕")
+    manifest.save()
+
+    loaded = Manifest(path)
+    assert loaded.get("hello", "auto", "ko") == "안녕"
+    assert loaded.get("hello", "auto", "ja") is None
+    assert loaded.stats() == {"entries": 1, "hits": 1, "misses": 1}
+
+
+def test_manifest_prune():
+    manifest = Manifest()
+    manifest.entries = {Manifest.key("old", "auto", "ko"): "옛"}
+    manifest.set("new", "auto", "ko", "새")
+
+    assert manifest.prune() == 1
+    assert manifest.get("new", "auto", "ko") == "새"
+    assert manifest.get("old", "auto", "ko") is None
+
+
+@pytest.mark.asyncio
+async def test_incremental_translation(tmp_path, make_translator):
+    queries = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = request.url.params["q"]
+        queries.append(query)
+        return httpx.Response(
+            200, text=json.dumps([[[query.upper(), query]], None, "en"])
+        )
+
+    translator = make_translator(handler)
+    path = str(tmp_path / "manifest.json")
+    source = tmp_path / "messages.json"
+
+    source.write_text(json.dumps({"a": "hello", "b": "world"}), encoding="utf-8")
+    documents = DocumentTranslator(translator, pack_size=1, manifest=Manifest(path))
+    await documents.translate_file(str(source), dest="ko")
+
+    source.write_text(json.dumps({"a": "hello", "b": "there"}), encoding="utf-8")
+    documents = DocumentTranslator(translator, pack_size=1, manifest=Manifest(path))
+    translated = await documents.translate_file(str(source), dest="ko")
+
+    assert json.loads(translated) == {"a": "HELLO", "b": "THERE"}
+    assert sorted(queries) == ["hello", "there", "world"]
+    assert documents.manifest.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_requests_are_not_recorded_in_lean_mode(make_translator):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(503)
+
+    translator = make_translator(handler, lean=True)
+    manifest = Manifest()
+    documents = DocumentTranslator(translator, manifest=manifest)
+
+    translations = await documents.translate_strings(["hello", "world"], dest="ko")
+
+    assert translations == {"hello": "hello", "world": "world"}
+    assert manifest.entries == {}
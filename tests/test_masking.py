@@ -0,0 +1,67 @@
+import json
+
+import httpx
+import pytest
+
+from googletrans.masking import mask, unmask
+
+
+def test_mask_and_unmask():
+    text = 'Hi {name}, see <a href="https://example.com">%s</a> &amp; https://x.org'
+    masked, pieces = mask(text)
+
+    assert masked == "Hi ⟦0⟧, see ⟦1⟧⟦2⟧⟦3⟧ ⟦4⟧ ⟦5⟧"
+    assert pieces[1] == '<a href="https://example.com">'
+    assert len(masked) < len(text)
+    assert unmask(masked, pieces) == text
+
+
+@pytest.mark.parametrize("text", ["20% of users", "50% sale", "Save 10% extra"])
+def test_mask_keeps_percent_signs(text):
+    assert mask(text) == (text, [])
+
+
+def test_unmask_is_tolerant():
+    pieces = ["{name}", "<b>"]
+
+    assert unmask("Bonjour ⟦ 1 ⟧⟦0 ⟧", pieces) == "Bonjour <b>{name}"
+    assert unmask("Bonjour ⟦0⟧", pieces) is None
+    assert unmask("⟦0⟧ ⟦0⟧ ⟦1⟧", pieces) is None
+    assert unmask("plain", []) == "plain"
+
+
+@pytest.mark.asyncio
+async def test_translate_protect(make_translator):
+    queries = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = request.url.params["q"]
+        queries.append(query)
+        # loses the tokens of the second text
+        translated = query.upper() if "⟦1⟧" not in query else "BROKEN"
+        return httpx.Response(200, text=json.dumps([[[translated, query]], None, "en"]))
+
+    translator = make_translator(handler, protect=True)
+
+    single = await translator.translate("Hello {name}", dest="ko")
+    results = await translator.translate(["hi %s", "a {x} b {y}"], dest="ko")
+    unprotected = await translator.translate("{x}", dest="ko", protect=False)
+    unprotected_list = await translator.translate(
+        ["Hi <b>x</b>", "Yo {n}"], dest="ko", protect=False
+    )
+
+    assert single.text == "HELLO {name}"
+    assert single.origin == "Hello {name}"
+    assert single.pronunciation == "Hello {name}"
+    assert [r.text for r in results] == ["HI %s", "A {X} B {Y}"]
+    assert queries == [
+        "Hello ⟦0⟧",
+        "hi ⟦0⟧",
+        "a ⟦0⟧ b ⟦1⟧",
+        "a {x} b {y}",
+        "{x}",
+        "Hi <b>x</b>",
+        "Yo {n}",
+    ]
+    assert unprotected.text == "{X}"
+    assert [r.text for r in unprotected_list] == ["HI <B>X</B>", "YO {N}"]
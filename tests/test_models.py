@@ -0,0 +1,156 @@
+import io
+import pickle
+
+import httpx
+import pytest
+
+from googletrans import Translator, serialization
+from googletrans.client import _restore_masked
+from googletrans.models import Detected, Translated
+
+RESPONSE = (
+    '[[["こんにちは。","안녕하세요.",null,null,1],'
+    '[null,null,"Kon\'nichiwa.","annyeonghaseyo."]],,"ko",,,,0.9]'
+)
+
+
+def respond(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, text=RESPONSE)
+
+
+def test_translated_loader_runs_once():
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return "pron", {"translation": []}
+
+    result = Translated("ko", "en", "a", "b", loader=loader)
+    assert calls == []
+
+    assert result.pronunciation == "pron"
+    assert result.extra_data == {"translation": []}
+    assert calls == [1]
+
+
+@pytest.mark.asyncio
+async def test_translate_decodes_details_lazily(make_translator):
+    result = await make_translator(respond).translate("안녕하세요.", dest="ja")
+
+    assert result._loader is not None
+    assert result.text == "こんにちは。"
+    assert result.src == "ko"
+    assert result.pronunciation == "Kon'nichiwa."
+    assert result.extra_data["confidence"] == 0.9
+    assert result._loader is None
+    assert result._response is not None
+
+
+@pytest.mark.asyncio
+async def test_lean_mode_drops_response(make_translator):
+    translator = make_translator(respond, lean=True)
+
+    result = await translator.translate("안녕하세요.", dest="ja")
+    detected = await translator.detect("안녕하세요.")
+
+    assert result._response is None
+    assert detected._response is None
+    assert result.pronunciation == "Kon'nichiwa."
+
+
+def test_results_are_slotted():
+    result = Translated("ko", "en", "a", "b", "c")
+
+    assert not hasattr(result, "__dict__")
+    assert result.to_tuple() == ("ko", "en", "a", "b", "c", None)
+    assert result.to_dict(["src", "text"]) == {"src": "ko", "text": "b"}
+    assert Translated.from_tuple(result.to_tuple()).to_dict() == result.to_dict()
+    assert Detected.from_dict({"lang": "ko", "confidence": 1}).lang == "ko"
+
+
+def test_jsonl_round_trip():
+    results = [
+        Translated("ko", "en", "안녕", "hi", "annyeong"),
+        Translated("ja", "en", "a", "b"),
+    ]
+    buffer = io.StringIO()
+
+    serialization.dump_jsonl(results, buffer)
+    buffer.seek(0)
+    loaded = list(serialization.load_jsonl(buffer))
+
+    assert [r.to_dict() for r in loaded] == [r.to_dict() for r in results]
+
+
+def test_msgpack_round_trip():
+    pytest.importorskip("msgpack")
+    results = [Detected("ko", 0.9), Detected("en", 1.0)]
+
+    loaded = serialization.unpackb(serialization.packb(results), cls=Detected)
+
+    assert [r.to_tuple() for r in loaded] == [r.to_tuple() for r in results]
+
+
+def recorder(requests):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return respond(request)
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_fields_trim_requested_parts(make_translator):
+    requests = []
+    translator = make_translator(recorder(requests))
+
+    text_only = await translator.translate("안녕하세요.", dest="ja", fields="text")
+    with_pron = await translator.translate(
+        "안녕하세요.", dest="ja", fields="pronunciation"
+    )
+    full = await translator.translate("안녕하세요.", dest="ja")
+
+    assert [r.url.params.get_list("dt") for r in requests] == [
+        ["t"],
+        ["t", "rm"],
+        ["at", "bd", "ex", "ld", "md", "qca", "rw", "rm", "ss", "t"],
+    ]
+    assert text_only.text == "こんにちは。"
+    assert text_only.extra_data is None
+    assert with_pron.pronunciation == "Kon'nichiwa."
+    assert with_pron.extra_data is None
+    assert full.extra_data["confidence"] == 0.9
+
+
+@pytest.mark.asyncio
+async def test_fields_default_applies_to_list_items(make_translator):
+    requests = []
+    translator = make_translator(recorder(requests), fields="text")
+
+    results = await translator.translate(["a", "b"], dest="ja")
+    overridden = await translator.translate(["c"], dest="ja", fields="full")
+
+    assert [r.url.params.get_list("dt") for r in requests[:2]] == [["t"], ["t"]]
+    assert all(result.extra_data is None for result in results)
+    assert len(requests[2].url.params.get_list("dt")) == 10
+    assert overridden[0].extra_data is not None
+
+
+def test_invalid_fields():
+    with pytest.raises(ValueError):
+        Translator(fields="everything")
+
+
+@pytest.mark.asyncio
+async def test_unloaded_results_pickle(make_translator):
+    for translator in (make_translator(respond), make_translator(respond, lean=True)):
+        result = await translator.translate("안녕하세요.", dest="ja")
+        # as done for texts translated with protect=True
+        _restore_masked(result, result.origin, [])
+        assert result._loader is not None
+
+        restored = pickle.loads(pickle.dumps(result))
+
+        assert restored.text == result.text
+        assert restored.pronunciation == result.pronunciation
+        assert restored.extra_data == result.extra_data
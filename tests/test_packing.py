@@ -0,0 +1,104 @@
+import json
+
+import httpx
+import pytest
+
+from googletrans import utils
+
+
+def fake_response(translated: str) -> str:
+    return json.dumps([[[translated, "", None, None, 10]], None, "en"])
+
+
+def test_pack_segments():
+    texts = ["a", "b", "", "multi\nline", "c", "d"]
+
+    packs, singles = utils.pack_segments(texts, max_items=2, max_chars=100)
+
+    assert packs == [[0, 1], [4, 5]]
+    assert singles == [2, 3]
+
+
+def test_pack_segments_char_budget():
+    packs, _ = utils.pack_segments(["aaaa", "bbbb", "cccc"], max_items=10, max_chars=10)
+
+    assert packs == [[0, 1], [2]]
+
+
+def test_unpack_segments():
+    assert utils.unpack_segments("A \n B", 2) == ["A", "B"]
+    assert utils.unpack_segments("A B", 2) is None
+
+
+@pytest.mark.asyncio
+async def test_translate_list_packed(make_translator):
+    queries = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = request.url.params["q"]
+        queries.append(query)
+        return httpx.Response(200, text=fake_response(query.upper()))
+
+    translator = make_translator(handler, list_operation_pack_size=10)
+    results = await translator.translate(["one", "two", "three"], dest="ko")
+
+    assert [r.text for r in results] == ["ONE", "TWO", "THREE"]
+    assert [r.origin for r in results] == ["one", "two", "three"]
+    assert queries == ["one\ntwo\nthree"]
+
+
+@pytest.mark.asyncio
+async def test_translate_list_packed_fallback(make_translator):
+    queries = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = request.url.params["q"]
+        queries.append(query)
+        return httpx.Response(200, text=fake_response(query.replace("\n", " ")))
+
+    translator = make_translator(handler, list_operation_pack_size=10)
+    results = await translator.translate(["one", "two"], dest="ko")
+
+    assert [r.text for r in results] == ["one", "two"]
+    assert queries == ["one\ntwo", "one", "two"]
+
+
+@pytest.mark.asyncio
+async def test_translate_long_text_chunked(make_translator):
+    queries = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = request.url.params["q"]
+        queries.append(query)
+        return httpx.Response(200, text=fake_response(query.upper()))
+
+    translator = make_translator(handler, max_chunk_bytes=20)
+    text = "First sentence. Second sentence.\n\nThird one."
+    result = await translator.translate(text, dest="ko")
+
+    assert result.origin == text
+    assert result.text == text.upper()
+    assert sorted(queries) == ["First sentence.", "Second sentence.", "Third one."]
+
+
+@pytest.mark.asyncio
+async def test_large_text_sent_as_post(make_translator):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.method == "POST":
+            query = dict(httpx.QueryParams(request.content.decode()))["q"]
+        else:
+            query = request.url.params["q"]
+        return httpx.Response(200, text=fake_response(query.upper()))
+
+    translator = make_translator(handler, post_threshold=10)
+    short = await translator.translate("short", dest="ko")
+    long = await translator.translate("a longer sentence", dest="ko")
+
+    assert [r.method for r in requests] == ["GET", "POST"]
+    assert "q" not in requests[1].url.params
+    assert requests[1].url.params["tl"] == "ko"
+    assert short.text == "SHORT"
+    assert long.text == "A LONGER SENTENCE"
@@ -0,0 +1,48 @@
+import json
+
+import httpx
+import pytest
+
+from googletrans.ratelimit import RateLimiter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("googletrans.ratelimit.time.monotonic", lambda: now[0])
+    return now
+
+
+def test_request_budget(clock):
+    limiter = RateLimiter(requests_per_second=2)
+
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == pytest.approx(0.5)
+    assert limiter.reserve() == pytest.approx(1.0)
+
+    clock[0] += 2
+    assert limiter.reserve() == 0
+
+
+def test_character_budget(clock):
+    limiter = RateLimiter(characters_per_second=100)
+
+    assert limiter.reserve(80) == 0
+    assert limiter.reserve(70) == pytest.approx(0.5)
+    assert limiter.waited == pytest.approx(0.5)
+
+
+@pytest.mark.asyncio
+async def test_shared_between_translators(clock, make_translator):
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = request.url.params["q"]
+        return httpx.Response(200, text=json.dumps([[[query, query]], None, "en"]))
+
+    limiter = RateLimiter(characters_per_second=1000)
+    for _ in range(2):
+        translator = make_translator(handler, rate_limiter=limiter)
+        await translator.translate("a" * 400)
+
+    assert limiter.reserve(200) == 0
+    assert limiter.reserve(1) > 0
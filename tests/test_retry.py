@@ -0,0 +1,104 @@
+import json
+
+import httpx
+import pytest
+
+from googletrans.constants import DUMMY_DATA
+from googletrans.exceptions import RequestError, TooManyRequests
+from googletrans.retry import RetryPolicy, parse_retry_after
+
+
+def scripted(responses):
+    """Handler answering the n-th request with the n-th response, repeating
+    the last one, and the list of requests it received"""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        result = responses[min(len(calls), len(responses)) - 1]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return handler, calls
+
+
+OK = httpx.Response(200, text=json.dumps([[["hello", "hola"]], None, "es"]))
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(httpx.Response(429, headers={"Retry-After": "3"})) == 3
+    assert parse_retry_after(httpx.Response(429)) is None
+    date = "Wed, 21 Oct 2015 07:28:00 GMT"
+    assert parse_retry_after(httpx.Response(429, headers={"Retry-After": date})) == 0
+
+
+def test_delay_backoff_and_retry_after():
+    policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+
+    assert [policy.delay(n) for n in (1, 2, 3, 4)] == [1, 2, 4, 5]
+    throttled = httpx.Response(429, headers={"Retry-After": "3"})
+    assert policy.delay(1, throttled) == 3
+
+
+@pytest.mark.asyncio
+async def test_retries_transient_errors(make_translator):
+    handler, calls = scripted(
+        [
+            httpx.Response(503),
+            httpx.ReadTimeout("timed out"),
+            OK,
+        ]
+    )
+    translator = make_translator(
+        handler, retry=RetryPolicy(max_attempts=3, backoff_factor=0)
+    )
+
+    result = await translator.translate("hola")
+
+    assert result.text == "hello"
+    assert result.status == 200
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_raises_typed_error_after_last_attempt(make_translator):
+    handler, calls = scripted([httpx.Response(429, headers={"Retry-After": "0"})])
+    translator = make_translator(
+        handler,
+        retry=RetryPolicy(max_attempts=2, backoff_factor=0),
+        raise_exception=True,
+    )
+
+    with pytest.raises(TooManyRequests) as exc_info:
+        await translator.translate("hola")
+
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.retry_after == 0
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_client_errors_are_not_retried(make_translator):
+    handler, calls = scripted([httpx.Response(403)])
+    translator = make_translator(
+        handler,
+        retry=RetryPolicy(backoff_factor=0),
+        raise_exception=True,
+    )
+
+    with pytest.raises(RequestError):
+        await translator.translate("hola")
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_dummy_data_is_not_shared(make_translator):
+    handler, _ = scripted([httpx.Response(403)])
+    translator = make_translator(handler)
+
+    result = await translator.translate("hola")
+
+    assert result.text == "hola"
+    assert result.status == 403
+    assert DUMMY_DATA[0][0][0] == ""
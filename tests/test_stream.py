@@ -0,0 +1,46 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_translate_stream_ordered_with_window(make_translator):
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        query = request.url.params["q"]
+        await asyncio.sleep(0.01 * (5 - int(query)))
+        in_flight -= 1
+        return httpx.Response(
+            200, text=json.dumps([[[query + "!", query]], None, "en"])
+        )
+
+    async def source():
+        for i in range(5):
+            yield str(i)
+
+    translator = make_translator(handler)
+    results = [r.text async for r in translator.translate_stream(source(), window=3)]
+
+    assert results == ["0!", "1!", "2!", "3!", "4!"]
+    assert peak <= 3
+
+
+@pytest.mark.asyncio
+async def test_translate_stream_unordered(make_translator):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        query = request.url.params["q"]
+        await asyncio.sleep(0.05 if query == "slow" else 0)
+        return httpx.Response(200, text=json.dumps([[[query, query]], None, "en"]))
+
+    translator = make_translator(handler)
+    stream = translator.translate_stream(["slow", "fast"], ordered=False, window=2)
+    results = [r.text async for r in stream]
+
+    assert results == ["fast", "slow"]
@@ -0,0 +1,23 @@
+import json
+
+import httpx
+
+from googletrans import SyncTranslator
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    query = request.url.params["q"]
+    return httpx.Response(200, text=json.dumps([[[query.upper(), query]], None, "en"]))
+
+
+def test_sync_translator_reuses_loop():
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    with SyncTranslator(client=client) as translator:
+        assert translator.translate("hello", dest="ko").text == "HELLO"
+        assert [r.text for r in translator.translate(["a", "b"])] == ["A", "B"]
+        assert [r.text for r in translator.translate_stream(iter(["c", "d"]))] == [
+            "C",
+            "D",
+        ]
+
+    assert not translator._thread.is_alive()
@@ -20,6 +20,20 @@ def test_format_json():
     ]
 
 
+def test_format_json_keeps_strings():
+    text = '[[["a,,b","[,\\"x\\",,"]],,"en"]'
+
+    result = utils.format_json(text)
+
+    assert result == [[["a,,b", '[,"x",,']], None, "en"]
+
+
+def test_fill_sparse_arrays_matches_legacy():
+    text = '[[["hi",,,null]],[,,[,1]],,"en",,,,0.5,,[["en"],,[0.5]]]'
+
+    assert utils.format_json(text) == utils.legacy_format_json(text)
+
+
 def test_format_malformed_json():
     text = '[,,"en",,,,0.96954316,,[["en"],,0.96954316]]]'
 
@@ -48,3 +62,37 @@ def test_build_params_with_override():
     )
 
     assert params["otf"] == "3"
+
+
+def test_split_text_keeps_short_text():
+    assert utils.split_text("hello world", 100) == ["hello world"]
+
+
+def test_split_text_prefers_paragraphs_and_sentences():
+    text = "First one. Second one.\nThird paragraph here."
+
+    chunks = utils.split_text(text, 25)
+
+    assert "".join(chunks) == text
+    assert chunks == ["First one. Second one.\n", "Third paragraph here."]
+    assert utils.split_text("One. Two. Three.", 10) == ["One. Two.", " Three."]
+
+
+def test_split_text_byte_budget():
+    text = "가" * 10
+
+    chunks = utils.split_text(text, 7)
+
+    assert "".join(chunks) == text
+    assert all(len(chunk.encode("utf-8")) <= 7 for chunk in chunks)
+
+
+def test_is_translatable():
+    for text in ["123", "SKU-1234X", "https://example.com/a?b=c", "{name}"]:
+        assert not utils.is_translatable(text)
+    for text in ["%(count)d %s", "😀👍", "v2.0", "a@b.com", "<br/>", "..."]:
+        assert not utils.is_translatable(text)
+    for text in ["Hello", "Hello {name}", "<b>Hi</b>", "3개", "USA-TODAY", "20% of"]:
+        assert utils.is_translatable(text)
+    for text in ["50% sale", "10% extra"]:
+        assert utils.is_translatable(text)